@@ -21,4 +21,44 @@ class AppConfig:
     # [변경됨] YOLOv8n -> YOLO26n (Ultralytics 최신 모델 적용)
     # yolo26n.pt: Nano 버전 (M1 Mac CPU 환경에 최적화됨)
     # 실행 시 자동으로 Ultralytics 서버에서 다운로드됩니다.
-    AI_MODEL_PATH: str = 'Detaction_CCTV/yolo26n.pt'
\ No newline at end of file
+    AI_MODEL_PATH: str = 'Detaction_CCTV/yolo26n.pt'
+
+    # 추론 백엔드: 'pytorch' (원본 .pt) | 'openvino' | 'onnx' | 'tensorrt' (NVIDIA GPU, FP16 엔진)
+    # pytorch 이외를 선택하면 최초 실행에서 한 번만 export 하고 이후에는 캐시된 모델을 로드합니다.
+    # (tensorrt 엔진은 AI_IMGSZ/AI_BATCH가 고정되므로 바꾸면 기존 .engine 파일을 삭제해야 함)
+    AI_MODEL_BACKEND: str = os.getenv("AI_MODEL_BACKEND", "pytorch")
+
+    # YOLO 추론 입력 크기 (연산량 ∝ imgsz²). 작게 하면 빠르지만 먼 거리의 작은 사람은 놓칠 수 있음
+    AI_IMGSZ: int = int(os.getenv("AI_IMGSZ", 640))
+
+    # 추론 장치: 'cpu' (기본, Mac 충돌 방지) | 'cuda' / 'cuda:0' (NVIDIA GPU, PyTorch 백엔드에서 FP16 추론)
+    AI_DEVICE: str = os.getenv("AI_DEVICE", "cpu")
+
+    # CPU 추론 시 PyTorch 연산 스레드 수 (0: PyTorch 기본값 유지, N>0: N개로 제한해 RTSP 디코딩/렌더링 스레드에 코어 양보)
+    AI_NUM_THREADS: int = int(os.getenv("AI_NUM_THREADS", 0))
+
+    # YOLO 배치 크기: N장의 프레임을 모아 한 번에 추론 (처리량 증가, 지연은 N 프레임만큼 증가)
+    AI_BATCH: int = int(os.getenv("AI_BATCH", 1))
+
+    # N 프레임마다 한 번만 YOLO 추론 (건너뛴 프레임은 직전 탐지 결과로 오버레이). 1이면 매 프레임 추론
+    AI_SKIP_FRAMES: int = int(os.getenv("AI_SKIP_FRAMES", 1))
+
+    # 화면 변화량에 따른 동적 프레임 스킵 (AI_SKIP_FRAMES는 최소 간격으로 사용)
+    # 64x64 흑백 축소본의 평균 밝기 차이가 LOW 미만이면 추론 간격을 2배로(최대 AI_SKIP_MAX), HIGH 초과면 즉시 추론
+    # 지연 트레이드오프: 정적인 장면에서는 최대 AI_SKIP_MAX 프레임(30fps에서 5프레임 ≈ 170ms)마다 한 번만 추론하므로,
+    # 변화량이 HIGH 미만인 느린 진입은 그만큼 늦게 감지되고 그동안 직전 박스가 표시됨 (기본 꺼짐)
+    AI_SKIP_ADAPTIVE: bool = os.getenv("AI_SKIP_ADAPTIVE", "false").lower() == "true"
+    AI_SKIP_MAX: int = int(os.getenv("AI_SKIP_MAX", 5))
+    AI_SKIP_DIFF_LOW: float = float(os.getenv("AI_SKIP_DIFF_LOW", 2.0))
+    AI_SKIP_DIFF_HIGH: float = float(os.getenv("AI_SKIP_DIFF_HIGH", 8.0))
+
+    # INT8 양자화 (openvino 백엔드 전용). 보정용 카메라 프레임(~100장)을 AI_CALIB_DIR에 넣어두면 사용
+    AI_MODEL_INT8: bool = os.getenv("AI_MODEL_INT8", "false").lower() == "true"
+    AI_CALIB_DIR: str = 'Detaction_CCTV/calib'
+
+    # Display Parameters
+    # 오버레이 그리기/imshow를 cv2.UMat(OpenCL)로 처리 (기본 꺼짐)
+    # rectangle/putText/imshow에는 OpenCL 커널이 없어 매 프레임 업로드/맵백 비용만 늘 수 있으므로, 측정 후 이득이 있을 때만 켤 것
+    DISPLAY_USE_OPENCL: bool = os.getenv("DISPLAY_USE_OPENCL", "false").lower() == "true"
+    # 화면 표시 최대 FPS (추론/PTZ 제어 주기와 별개로 imshow 호출만 제한, 0이면 제한 없음)
+    DISPLAY_MAX_FPS: float = float(os.getenv("DISPLAY_MAX_FPS", 30))
@@ -4,7 +4,8 @@ os.environ['KMP_DUPLICATE_LIB_OK'] = 'True'
 import cv2
 import time
 import sys
-from typing import Tuple, List, Dict, Optional
+from enum import IntEnum
+from typing import Tuple, Optional
 
 from config import AppConfig
 from services import (
@@ -12,9 +13,18 @@ from services import (
     PTZCameraManager, 
     VisionProcessor, 
     VisualPriorityManager,
-    ReIDManager 
+    ReIDManager,
+    InferenceWorker,
+    Detections
 )
 
+class SystemMode(IntEnum):
+    """시스템 동작 모드 (문자열 비교 대신 정수 비교)"""
+    PATROL = 0     # 순찰
+    SEARCHING = 1  # 타겟을 놓친 직후 대기
+    TRACKING = 2   # 타겟 추적
+
+
 class SurveillanceSystemController:
     """스마트 CCTV 시스템의 메인 컨트롤러"""
 
@@ -28,22 +38,50 @@ class SurveillanceSystemController:
         # 서비스 모듈 초기화
         self.stream_handler = VideoStreamHandler(self.config.RTSP_URL).start()
         self.ptz = PTZCameraManager(self.config)
-        self.vision = VisionProcessor(self.config.AI_MODEL_PATH, self.config.AI_CONFIDENCE)
+        self.vision = VisionProcessor(
+            self.config.AI_MODEL_PATH,
+            self.config.AI_CONFIDENCE,
+            backend=self.config.AI_MODEL_BACKEND,
+            int8=self.config.AI_MODEL_INT8,
+            calib_dir=self.config.AI_CALIB_DIR,
+            imgsz=self.config.AI_IMGSZ,
+            device=self.config.AI_DEVICE,
+            batch=self.config.AI_BATCH,
+            num_threads=self.config.AI_NUM_THREADS,
+        )
         self.priority_manager = VisualPriorityManager()
         self.reid_manager = ReIDManager(similarity_threshold=0.75)
+        # 캡처(stream_handler) -> 추론(inference_worker) -> 렌더링/PTZ(run) 3단계 파이프라인
+        self.inference_worker = InferenceWorker(
+            self.stream_handler, self.vision, self.reid_manager,
+            batch_size=self.config.AI_BATCH,
+            skip_frames=self.config.AI_SKIP_FRAMES,
+            adaptive_skip=self.config.AI_SKIP_ADAPTIVE,
+            max_skip=self.config.AI_SKIP_MAX,
+            diff_low=self.config.AI_SKIP_DIFF_LOW,
+            diff_high=self.config.AI_SKIP_DIFF_HIGH,
+        )
         
         # 시스템 상태 변수
         self.is_running: bool = True
-        self.current_mode: str = "PATROL"  # 초기 모드는 순찰
-        self.last_event_time: float = time.time() # 마지막 유의미한 이벤트(객체 탐지) 시간
-        self.tracked_target: Optional[Dict] = None # 현재 추적 중인 객체 정보
+        self.current_mode: SystemMode = SystemMode.PATROL  # 초기 모드는 순찰
+        self.last_event_time: float = time.monotonic() # 마지막 유의미한 이벤트(객체 탐지) 시간
+        self.tracked_target_id: Optional[int] = None # 현재 추적 중인 객체의 영구 ID
+        self.last_sorted_objects: Detections = Detections.empty() # 추론 생략 프레임에서 재사용할 마지막 결과
         
         self.center_x, self.center_y = 0, 0
+        self._inv_cx, self._inv_cy = 0.0, 0.0  # 1/center (해상도가 바뀔 때만 재계산)
+
+        # 시각화 전용 OpenCL 사용 여부 (Re-ID 등 numpy 슬라이싱이 필요한 경로는 그대로 ndarray 사용)
+        self.use_opencl: bool = self.config.DISPLAY_USE_OPENCL and cv2.ocl.haveOpenCL()
+        # 화면 표시 최소 간격 (DISPLAY_MAX_FPS 초과 프레임은 그리기/imshow 생략)
+        self.display_interval: float = 1.0 / self.config.DISPLAY_MAX_FPS if self.config.DISPLAY_MAX_FPS > 0 else 0.0
+        self.last_display_time: float = 0.0
 
     def _calculate_pid_output(self, target_cx: float, target_cy: float) -> Tuple[float, float]:
         """PID 제어를 통해 모터 속도 계산 (P 제어기)"""
-        # 0으로 나누기 오류 방지
-        if self.center_x == 0 or self.center_y == 0:
+        # 0으로 나누기 오류 방지 (center가 0이면 _inv_cx/_inv_cy도 0)
+        if self._inv_cx == 0.0 or self._inv_cy == 0.0:
             return 0.0, 0.0
 
         error_x = target_cx - self.center_x
@@ -53,31 +91,27 @@ class SurveillanceSystemController:
         tilt_velocity = 0.0
 
         if abs(error_x) > self.config.DEAD_ZONE_PIXELS:
-            pan_velocity = (error_x / self.center_x) * self.config.PID_KP
+            pan_velocity = error_x * self._inv_cx * self.config.PID_KP
             
         if abs(error_y) > self.config.DEAD_ZONE_PIXELS:
-            tilt_velocity = -(error_y / self.center_y) * self.config.PID_KP
+            tilt_velocity = -error_y * self._inv_cy * self.config.PID_KP
             
         return max(-1.0, min(1.0, pan_velocity)), max(-1.0, min(1.0, tilt_velocity))
 
-    def _draw_overlay(self, frame, all_objects: List[Dict]):
-        """프레임에 객체 정보 및 현재 상태를 그리는 함수"""
+    def _draw_overlay(self, frame, all_objects: Detections):
+        """프레임(ndarray 또는 cv2.UMat)에 객체 정보 및 현재 상태를 그리는 함수"""
         # 현재 추적중인 타겟 ID 확인
-        target_id = self.tracked_target.get('permanent_id') if self.tracked_target else None
+        target_id = self.tracked_target_id
 
-        for obj in all_objects:
-            is_target = (target_id is not None) and (obj['permanent_id'] == target_id)
-            
-            x1, y1, x2, y2 = obj['box']
-            name = obj.get('name', 'unknown')
-            score = obj.get('priority_score', 0)
+        for (x1, y1, x2, y2), name, perm_id, score in all_objects.to_draw_iter():
+            is_target = (target_id is not None) and (perm_id == target_id)
             
             color = (0, 0, 255) if is_target else (0, 255, 255)
             thickness = 3 if is_target else 1
             
             cv2.rectangle(frame, (x1, y1), (x2, y2), color, thickness)
             
-            label = f"ID:{obj.get('permanent_id', -1)} {name} ({score:.2f})"
+            label = f"ID:{perm_id} {name} ({score:.2f})"
             if is_target:
                 label += " [TARGET]"
             
@@ -85,75 +119,102 @@ class SurveillanceSystemController:
                         cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
         
         # 전체 시스템 모드 정보 표시
-        cv2.putText(frame, f"MODE: {self.current_mode}", (20, 40), 
+        cv2.putText(frame, f"MODE: {self._mode_label()}", (20, 40), 
                     cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
 
 
+    def _mode_label(self) -> str:
+        """화면 표시용 모드 문자열"""
+        if self.current_mode == SystemMode.TRACKING:
+            return f"TRACKING (ID: {self.tracked_target_id})"
+        return self.current_mode.name
+
+    def _show(self, frame, objects: Detections):
+        """오버레이를 그려 화면에 표시 (OpenCL 사용 시 그리기/표시를 UMat으로 처리)"""
+        now = time.monotonic()
+        if now - self.last_display_time < self.display_interval:
+            return
+        self.last_display_time = now
+
+        display = cv2.UMat(frame) if self.use_opencl else frame
+        self._draw_overlay(display, objects)
+        cv2.imshow("Smart CCTV", display)
+
+    def _handle_frame(self, frame, identified_objects: Detections, did_infer: bool = True):
+        """한 프레임의 인지 결과(YOLO + Re-ID)로 우선순위 -> PTZ 제어 -> 시각화 수행"""
+        if not did_infer:
+            # 추론 생략 프레임: 상태/PTZ는 그대로 두고 마지막 결과로 오버레이만 갱신
+            self._show(frame, self.last_sorted_objects)
+            return
+
+        now = time.monotonic()
+        h, w = frame.shape[:2]
+        if (self.center_x, self.center_y) != (w // 2, h // 2):
+            self.center_x, self.center_y = w // 2, h // 2
+            self._inv_cx = 1.0 / self.center_x if self.center_x else 0.0
+            self._inv_cy = 1.0 / self.center_y if self.center_y else 0.0
+        
+        # 1. AI 인지 (YOLO + Re-ID)는 InferenceWorker 스레드에서 수행됨
+        # 2. 우선순위 결정 (점수가 높은 순으로 정렬된 Detections)
+        sorted_objects = self.priority_manager.calculate_priorities(identified_objects, w, h)
+        self.last_sorted_objects = sorted_objects
+        
+        # 3. 행동 결정 (상태 머신)
+        # 3-1. 추적할 객체가 하나 이상 존재하는 경우
+        if len(sorted_objects) > 0:
+            self.last_event_time = now # 마지막 객체 탐지 시간 갱신
+            
+            # 현재 추적하던 타겟이 계속 보이는지 확인 (영구 ID로 행 검색)
+            target_idx = -1
+            if self.tracked_target_id is not None:
+                target_idx = sorted_objects.index_of(self.tracked_target_id)
+            
+            # 현재 타겟이 안보이면, 최우선 순위 객체를 새로운 타겟으로 설정
+            if target_idx < 0:
+                target_idx = 0
+                self.tracked_target_id = int(sorted_objects.perm_ids[0])
+            
+            # 타겟팅 및 PTZ 제어
+            self.current_mode = SystemMode.TRACKING
+            
+            tx, ty = sorted_objects.centers[target_idx].tolist()
+            pan, tilt = self._calculate_pid_output(tx, ty)
+            self.ptz.move_async(pan, tilt)
+
+        # 3-2. 추적할 객체가 아무도 없는 경우
+        else:
+            # 타겟을 잃어버린 직후라면 잠시 대기
+            if self.current_mode == SystemMode.TRACKING:
+                self.tracked_target_id = None
+                self.current_mode = SystemMode.SEARCHING
+                self.ptz.stop() # 카메라 움직임 정지
+            
+            # 대기 시간(SEARCHING)이 충분히 지났다면 순찰 모드로 전환
+            if now - self.last_event_time > self.PATROL_RETURN_DELAY_SECONDS:
+                self.current_mode = SystemMode.PATROL
+                self.ptz.move_async(self.config.PATROL_SPEED, 0.0)
+
+        # 4. 시각화
+        self._show(frame, sorted_objects)
+
     def run(self):
         """메인 실행 루프"""
         print("[System] System Started.")
         cv2.namedWindow("Smart CCTV", cv2.WINDOW_NORMAL)
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+
+        self.inference_worker.start()
 
         try:
             while self.is_running:
-                frame = self.stream_handler.get_frame()
-                if frame is None:
-                    time.sleep(0.01) # 프레임이 없을 경우 CPU 과부하 방지
-                    continue
-                
-                h, w = frame.shape[:2]
-                self.center_x, self.center_y = w // 2, h // 2
-                
-                # 1. AI 인지 (YOLO + Re-ID)
-                raw_objects, _ = self.vision.process_frame(frame)
-                identified_objects = self.reid_manager.update_ids(frame, raw_objects)
-                
-                # 2. 우선순위 결정 (점수가 높은 순으로 정렬된 리스트)
-                sorted_objects = self.priority_manager.calculate_priorities(identified_objects, w, h)
-                
-                # 3. 행동 결정 (상태 머신)
-                # 3-1. 추적할 객체가 하나 이상 존재하는 경우
-                if sorted_objects:
-                    self.last_event_time = time.time() # 마지막 객체 탐지 시간 갱신
-                    
-                    # 현재 추적하던 타겟이 계속 보이는지 확인
-                    current_target_still_visible = False
-                    if self.tracked_target:
-                        for obj in sorted_objects:
-                            if obj['permanent_id'] == self.tracked_target['permanent_id']:
-                                self.tracked_target = obj # 최신 정보로 업데이트
-                                current_target_still_visible = True
-                                break
-                    
-                    # 현재 타겟이 안보이면, 최우선 순위 객체를 새로운 타겟으로 설정
-                    if not current_target_still_visible:
-                        self.tracked_target = sorted_objects[0]
-                    
-                    # 타겟팅 및 PTZ 제어
-                    target_name = self.tracked_target.get('name', 'Object')
-                    self.current_mode = f"TRACKING (ID: {self.tracked_target.get('permanent_id', -1)})"
-                    
-                    tx, ty = self.tracked_target['center']
-                    pan, tilt = self._calculate_pid_output(tx, ty)
-                    self.ptz.move_async(pan, tilt)
-
-                # 3-2. 추적할 객체가 아무도 없는 경우
-                else:
-                    # 타겟을 잃어버린 직후라면 잠시 대기
-                    if self.current_mode.startswith("TRACKING"):
-                        self.tracked_target = None
-                        self.current_mode = "SEARCHING"
-                        self.ptz.stop() # 카메라 움직임 정지
-                    
-                    # 대기 시간(SEARCHING)이 충분히 지났다면 순찰 모드로 전환
-                    if time.time() - self.last_event_time > self.PATROL_RETURN_DELAY_SECONDS:
-                        self.current_mode = "PATROL"
-                        self.ptz.move_async(self.config.PATROL_SPEED, 0.0)
-
-                # 4. 시각화
-                self._draw_overlay(frame, sorted_objects)
-                cv2.imshow("Smart CCTV", frame)
+                # 추론 스레드의 최신 결과만 렌더링 (렌더링이 밀리면 이전 결과는 버려짐)
+                # -> PTZ도 항상 최신 탐지 결과로만 제어됨
+                result = self.inference_worker.get_result(timeout=0.1)
+                if result is not None:
+                    frame, identified_objects, did_infer = result
+                    self._handle_frame(frame, identified_objects, did_infer)
                 
+                # 결과가 없어도 키 입력/창 이벤트는 계속 처리
                 if cv2.waitKey(1) & 0xFF == ord('q'):
                     self.is_running = False
 
@@ -167,6 +228,7 @@ class SurveillanceSystemController:
         self.is_running = False
         time.sleep(0.5) 
         
+        if hasattr(self, 'inference_worker'): self.inference_worker.stop()
         if hasattr(self, 'stream_handler'): self.stream_handler.release()
         if hasattr(self, 'ptz'): self.ptz.stop()
             
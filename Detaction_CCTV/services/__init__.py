@@ -3,11 +3,15 @@ from .ptz_controller import PTZCameraManager
 from .vision_processor import VisionProcessor
 from .priority_manager import VisualPriorityManager  # <--- 이름 확인
 from .reid_manager import ReIDManager
+from .inference_worker import InferenceWorker
+from .detections import Detections
 
 __all__ = [
     "VideoStreamHandler",
     "PTZCameraManager",
     "VisionProcessor",
     "VisualPriorityManager", # <--- 이름 확인
-    "ReIDManager"
+    "ReIDManager",
+    "InferenceWorker",
+    "Detections"
 ]
\ No newline at end of file
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class Detections:
+    """
+    한 프레임의 탐지 결과를 필드별 배열로 보관하는 SoA(Structure of Arrays) 컨테이너
+    VisionProcessor -> ReIDManager -> VisualPriorityManager -> 시각화까지 그대로 전달되며,
+    객체마다 dict를 만들지 않고 배열 단위로 연산합니다.
+    """
+    boxes: np.ndarray                    # (N, 4) [x1, y1, x2, y2]
+    ids: np.ndarray                      # (N,) YOLO 트래킹 ID
+    clss: np.ndarray                     # (N,) 클래스 ID
+    centers: np.ndarray                  # (N, 2) 박스 중심 좌표
+    perm_ids: np.ndarray = None          # (N,) Re-ID 영구 ID (-1: 미부여)
+    scores: np.ndarray = None            # (N,) 우선순위 점수
+    names: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        n = len(self.boxes)
+        if self.perm_ids is None:
+            self.perm_ids = np.full(n, -1, dtype=np.int64)
+        if self.scores is None:
+            self.scores = np.zeros(n, dtype=np.float64)
+        if not self.names:
+            self.names = [''] * n
+
+    @classmethod
+    def empty(cls) -> 'Detections':
+        return cls(
+            boxes=np.empty((0, 4), dtype=np.float32),
+            ids=np.empty(0, dtype=np.int64),
+            clss=np.empty(0, dtype=np.int64),
+            centers=np.empty((0, 2), dtype=np.float32),
+        )
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def filter(self, indices: np.ndarray) -> 'Detections':
+        """인덱스 배열(또는 boolean mask)에 해당하는 객체만 남긴 새 Detections 반환 (순서 유지)"""
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        return Detections(
+            boxes=self.boxes[indices],
+            ids=self.ids[indices],
+            clss=self.clss[indices],
+            centers=self.centers[indices],
+            perm_ids=self.perm_ids[indices],
+            scores=self.scores[indices],
+            names=[self.names[i] for i in indices.tolist()],
+        )
+
+    def index_of(self, perm_id: int) -> int:
+        """영구 ID에 해당하는 행 번호 반환 (없으면 -1)"""
+        matches = np.flatnonzero(self.perm_ids == perm_id)
+        return int(matches[0]) if len(matches) else -1
+
+    def to_draw_iter(self) -> Iterator[Tuple[List[int], str, int, float]]:
+        """시각화용 (box, name, perm_id, score) 순회 (배열을 한 번에 Python 값으로 변환)"""
+        return zip(self.boxes.astype(int).tolist(), self.names,
+                   self.perm_ids.tolist(), self.scores.tolist())
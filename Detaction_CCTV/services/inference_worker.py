@@ -0,0 +1,136 @@
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .stream_handler import VideoStreamHandler
+from .vision_processor import VisionProcessor
+from .reid_manager import ReIDManager
+from .detections import Detections
+
+
+class InferenceWorker(threading.Thread):
+    """
+    캡처된 최신 프레임에 대해 YOLO + Re-ID를 수행하는 추론 스레드
+    결과는 크기 1의 큐에 (frame, identified_objects, did_infer) 형태로 올라가며,
+    렌더링 스레드가 가져가기 전에 새 결과가 나오면 이전 결과는 버림 (항상 최신 프레임 처리)
+
+    skip_frames > 1이면 N 프레임마다 한 번만 추론하고, 건너뛴 프레임에는
+    마지막 인지 결과를 did_infer=False로 함께 전달 (오버레이 재사용용)
+
+    adaptive_skip=True이면 마지막 추론 프레임 대비 변화량(축소 흑백 이미지의 평균 절대 차이)에 따라
+    추론 간격을 skip_frames ~ max_skip 사이에서 조절 (정지 장면은 간격 2배, 변화가 있으면 최소 간격, 큰 변화는 즉시 추론)
+    """
+    MOTION_SIZE = (64, 64)  # 변화량 계산용 축소 크기
+
+    def __init__(self, stream_handler: VideoStreamHandler, vision: VisionProcessor,
+                 reid_manager: ReIDManager, batch_size: int = 1, skip_frames: int = 1,
+                 adaptive_skip: bool = False, max_skip: int = 30,
+                 diff_low: float = 2.0, diff_high: float = 8.0):
+        super().__init__(daemon=True)
+        self.stream_handler = stream_handler
+        self.vision = vision
+        self.reid_manager = reid_manager
+        self.batch_size = max(1, batch_size)
+        self.skip_frames = max(1, skip_frames)
+        self.frame_count = 0
+
+        # 동적 스킵 상태
+        self.adaptive_skip = adaptive_skip
+        self.max_skip = max(self.skip_frames, max_skip)
+        self.diff_low = diff_low
+        self.diff_high = diff_high
+        self.current_skip = self.skip_frames
+        self.frames_since_infer = 0
+        self._ref_small: Optional[np.ndarray] = None  # 마지막 추론 프레임의 축소 흑백 이미지
+        self._scene_diff = 0.0
+        self.last_identified_objects: Detections = Detections.empty()
+
+        self.is_running: bool = False
+        self._results: "queue.Queue[Tuple[np.ndarray, Detections, bool]]" = queue.Queue(maxsize=1)
+
+    def start(self) -> 'InferenceWorker':
+        self.is_running = True
+        super().start()
+        return self
+
+    def run(self) -> None:
+        # batch_size개의 프레임을 모아 한 번에 YOLO 추론 (1이면 프레임 단위 처리)
+        frame_batch: List[np.ndarray] = []
+
+        while self.is_running:
+            frame = self.stream_handler.get_frame()
+            if frame is None:
+                time.sleep(0.01) # 프레임이 없을 경우 CPU 과부하 방지
+                continue
+
+            self.frame_count += 1
+            self.frames_since_infer += 1
+            small = self._motion_thumbnail(frame) if self.adaptive_skip else None
+            if small is not None and self._ref_small is not None:
+                self._scene_diff = cv2.absdiff(self._ref_small, small).mean()
+                if self._scene_diff > self.diff_high:
+                    # 큰 변화: 최소 간격으로 복귀하고 이번 프레임은 바로 추론
+                    self.current_skip = self.skip_frames
+                    self.frames_since_infer = self.current_skip
+
+            if self.frames_since_infer < self.current_skip:
+                # 추론 생략 프레임: 직전 결과를 재사용
+                # - 배치를 모으는 중이면 표시 순서가 뒤섞이지 않도록 전달하지 않음
+                # - 아직 소비되지 않은 결과(특히 새 추론 결과)를 덮어쓰지 않도록 큐가 비었을 때만 전달
+                if not frame_batch and self._results.empty():
+                    self._results.put_nowait((frame, self.last_identified_objects, False))
+                continue
+
+            self.frames_since_infer = 0
+            if small is not None:
+                if self._ref_small is not None and self._scene_diff < self.diff_low:
+                    # 정지 장면: 다음 추론까지의 간격 2배 (최대 max_skip)
+                    self.current_skip = min(self.current_skip * 2, self.max_skip)
+                else:
+                    # 변화가 있으면 최소 간격으로 복귀
+                    self.current_skip = self.skip_frames
+                self._ref_small = small
+            frame_batch.append(frame)
+            if len(frame_batch) < self.batch_size:
+                continue
+
+            try:
+                batch_objects = self.vision.process_frames(frame_batch)
+                for batch_frame, raw_objects in zip(frame_batch, batch_objects):
+                    # Re-ID용 HSV 변환은 프레임당 한 번만 (객체가 없으면 생략)
+                    hsv_frame = cv2.cvtColor(batch_frame, cv2.COLOR_BGR2HSV) if len(raw_objects) else None
+                    identified_objects = self.reid_manager.update_ids(batch_frame, hsv_frame, raw_objects)
+                    self.last_identified_objects = identified_objects
+                    self._publish((batch_frame, identified_objects, True))
+            except Exception as e:
+                print(f"[Inference] Error: {e}")
+            frame_batch.clear()
+
+    def _motion_thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """변화량 계산용 축소 흑백 이미지"""
+        small = cv2.resize(frame, self.MOTION_SIZE, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def _publish(self, result: Tuple[np.ndarray, Detections, bool]) -> None:
+        # drop-oldest: 아직 소비되지 않은 이전 결과는 버리고 최신 결과만 유지
+        try:
+            self._results.get_nowait()
+        except queue.Empty:
+            pass
+        self._results.put_nowait(result)
+
+    def get_result(self, timeout: float = 0.1) -> Optional[Tuple[np.ndarray, Detections, bool]]:
+        """최신 추론 결과 반환 (timeout 내에 없으면 None)"""
+        try:
+            return self._results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def stop(self) -> None:
+        self.is_running = False
+        if self.is_alive():
+            self.join()
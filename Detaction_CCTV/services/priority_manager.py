@@ -1,5 +1,6 @@
-from typing import List, Dict
-import math
+import numpy as np
+
+from .detections import Detections
 
 class VisualPriorityManager:
     """
@@ -24,49 +25,52 @@ class VisualPriorityManager:
         'default': 0.2  # 나머지
     }
 
-    def calculate_priorities(self, objects: List[Dict], frame_width: int, frame_height: int) -> List[Dict]:
+    def calculate_priorities(self, detections: Detections, frame_width: int, frame_height: int) -> Detections:
         """
-        모든 객체에 대해 우선순위 점수를 계산하고, 점수가 높은 순으로 정렬된 리스트를 반환합니다.
+        모든 객체에 대해 우선순위 점수를 계산하고, 점수가 높은 순으로 정렬된 Detections를 반환합니다.
 
         [입력]
-         - objects: ReID가 완료된 객체 리스트
+         - detections: ReID가 완료된 객체 배열 (Detections)
          - frame_width: 프레임 너비
          - frame_height: 프레임 높이
         
         [출력]
-         - 'priority_score'가 추가되고 점수 순으로 정렬된 객체 리스트
+         - scores가 채워지고 점수 순으로 정렬된 Detections
         """
-        if not objects:
-            return []
+        if len(detections) == 0:
+            return detections
 
         frame_area = frame_width * frame_height
         frame_center_x = frame_width / 2
         frame_center_y = frame_height / 2
-        max_dist = math.sqrt(frame_center_x**2 + frame_center_y**2)
+        max_dist = np.hypot(frame_center_x, frame_center_y)
+
+        # 필드별 배열에서 점수를 한 번에 계산 (객체별 Python 연산 제거)
+        boxes = detections.boxes.astype(np.float64, copy=False)
+        centers = detections.centers.astype(np.float64, copy=False)
+        n = len(detections)
+
+        # 1. 종류 점수 (Type Score)
+        default_type_score = self.TYPE_SCORES['default']
+        type_scores = np.fromiter(
+            (self.TYPE_SCORES.get(name, default_type_score) for name in detections.names),
+            dtype=np.float64, count=n
+        )
 
-        for obj in objects:
-            # 1. 종류 점수 (Type Score)
-            obj_name = obj.get('name', '')
-            type_score = self.TYPE_SCORES.get(obj_name, self.TYPE_SCORES['default'])
+        # 2. 크기 점수 (Size Score)
+        areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+        size_scores = areas / frame_area if frame_area > 0 else np.zeros(n)
 
-            # 2. 크기 점수 (Size Score)
-            box = obj['box']
-            area = (box[2] - box[0]) * (box[3] - box[1])
-            size_score = area / frame_area if frame_area > 0 else 0
+        # 3. 위치 점수 (Position Score)
+        dists = np.hypot(centers[:, 0] - frame_center_x, centers[:, 1] - frame_center_y)
+        position_scores = 1.0 - (dists / max_dist) if max_dist > 0 else np.zeros(n)
 
-            # 3. 위치 점수 (Position Score)
-            obj_center_x, obj_center_y = obj['center']
-            dist = math.sqrt((obj_center_x - frame_center_x)**2 + (obj_center_y - frame_center_y)**2)
-            position_score = 1.0 - (dist / max_dist) if max_dist > 0 else 0
-            
-            # 최종 우선순위 점수 계산
-            score = (self.WEIGHTS['type'] * type_score) + \
-                    (self.WEIGHTS['size'] * size_score) + \
-                    (self.WEIGHTS['position'] * position_score)
-            
-            obj['priority_score'] = score
+        # 최종 우선순위 점수 계산
+        detections.scores = (self.WEIGHTS['type'] * type_scores) + \
+                            (self.WEIGHTS['size'] * size_scores) + \
+                            (self.WEIGHTS['position'] * position_scores)
 
-        # 점수가 높은 순으로 객체 리스트 정렬
-        sorted_objects = sorted(objects, key=lambda o: o.get('priority_score', 0), reverse=True)
+        # 점수가 높은 순으로 정렬 (동점이면 입력 순서 유지)
+        order = np.argsort(-detections.scores, kind='stable')
         
-        return sorted_objects
\ No newline at end of file
+        return detections.filter(order)
@@ -1,11 +1,20 @@
 import threading
+import time
+from typing import Optional, Tuple
 from onvif import ONVIFCamera
 from config import AppConfig
 
 class PTZCameraManager:
+    # 명령 전송 최소 간격 (초). 그 사이에 들어온 명령은 가장 최신 것 하나로 합쳐짐
+    MIN_COMMAND_INTERVAL = 0.05
+
     def __init__(self, config: AppConfig):
         self._connected: bool = False
         self._profile_token: str = ""
+
+        # 전송 대기 중인 최신 명령 1개: ('move', pan, tilt, zoom) 또는 ('stop',)
+        self._latest_cmd: Optional[Tuple] = None
+        self._cmd_cond = threading.Condition()
         
         try:
             self.cam = ONVIFCamera(
@@ -18,35 +27,67 @@ class PTZCameraManager:
             
             self._move_request = self.ptz_service.create_type('ContinuousMove')
             self._move_request.ProfileToken = self._profile_token
+            # Velocity 구조는 한 번만 만들고 매 명령마다 값만 갱신 (dict 재생성 없음)
+            self._pan_tilt = {'x': 0.0, 'y': 0.0}
+            self._zoom = {'x': 0.0}
+            self._move_request.Velocity = {'PanTilt': self._pan_tilt, 'Zoom': self._zoom}
             
             self._connected = True
             print("[PTZ] Camera control connected.")
         except Exception as e:
             print(f"[PTZ] Connection failed: {e}")
 
+        if self._connected:
+            # 단일 전송 스레드: 명령마다 스레드를 만들지 않고, 네트워크 호출이 밀려도 호출자는 블로킹되지 않음
+            threading.Thread(target=self._command_loop, daemon=True).start()
+
     def move_async(self, pan: float, tilt: float, zoom: float = 0.0) -> None:
         # MainThread blocking Async PTZ Move Command
         if not self._connected: return
-        threading.Thread(
-            target=self._send_command, args=(pan, tilt, zoom), daemon=True
-        ).start()
+        self._submit(('move', pan, tilt, zoom))
+
+    def stop(self) -> None:
+        if not self._connected: return
+        self._submit(('stop',))
+
+    def _submit(self, cmd: Tuple) -> None:
+        # 아직 전송되지 않은 이전 명령은 덮어씀 (추적/순찰 전환 시 이전 명령이 뒤에 쌓이지 않음)
+        with self._cmd_cond:
+            self._latest_cmd = cmd
+            self._cmd_cond.notify()
+
+    def _command_loop(self) -> None:
+        last_sent = 0.0
+        while True:
+            with self._cmd_cond:
+                while self._latest_cmd is None:
+                    self._cmd_cond.wait()
+
+            # 최소 간격 유지 (대기 중 들어온 명령은 슬롯에서 최신 것으로 교체됨)
+            wait = self.MIN_COMMAND_INTERVAL - (time.monotonic() - last_sent)
+            if wait > 0:
+                time.sleep(wait)
+
+            with self._cmd_cond:
+                cmd, self._latest_cmd = self._latest_cmd, None
+
+            if cmd[0] == 'move':
+                self._send_command(*cmd[1:])
+            else:
+                self._stop_routine()
+            last_sent = time.monotonic()
 
     def _send_command(self, pan: float, tilt: float, zoom: float) -> None:
         try:
-            self._move_request.Velocity = {
-                'PanTilt': {'x': pan, 'y': tilt},
-                'Zoom': {'x': zoom}
-            }
+            self._pan_tilt['x'] = pan
+            self._pan_tilt['y'] = tilt
+            self._zoom['x'] = zoom
             self.ptz_service.ContinuousMove(self._move_request)
         except Exception:
             pass
 
-    def stop(self) -> None:
-        if not self._connected: return
-        threading.Thread(target=self._stop_routine, daemon=True).start()
-
     def _stop_routine(self):
         try:
             self.ptz_service.Stop({'ProfileToken': self._profile_token})
         except Exception:
-            pass
\ No newline at end of file
+            pass
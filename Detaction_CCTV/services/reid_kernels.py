@@ -0,0 +1,75 @@
+"""
+Re-ID 전처리용 Numba JIT 커널
+numba가 설치되어 있지 않으면 HAS_NUMBA = False 이며, ReIDManager는 OpenCV(calcHist) 경로를 사용합니다.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+H_BINS = 16
+S_BINS = 16
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def hs_hist(hsv_roi, out):
+        """
+        HSV ROI에서 H-S 2D 히스토그램을 직접 계산 (calcHist + normalize를 한 번의 순회로 결합)
+        - 입력은 OpenCV 8bit HSV (H: 0~179, S: 0~255), 프레임 단위로 미리 변환된 이미지의 슬라이스
+        - 결과는 out(H_BINS, S_BINS)에 기록 후 NORM_MINMAX(0~1) 정규화
+        """
+        out[:, :] = 0.0
+        rows, cols = hsv_roi.shape[0], hsv_roi.shape[1]
+        for y in range(rows):
+            for x in range(cols):
+                h_bin = np.int32(hsv_roi[y, x, 0]) * H_BINS // 180
+                s_bin = np.int32(hsv_roi[y, x, 1]) * S_BINS // 256
+                # H 180 이상은 calcHist 범위 밖이므로 제외
+                if h_bin < H_BINS:
+                    out[h_bin, s_bin] += 1.0
+
+        lo = out.min()
+        hi = out.max()
+        if hi > lo:
+            scale = 1.0 / (hi - lo)
+            for i in range(H_BINS):
+                for j in range(S_BINS):
+                    out[i, j] = (out[i, j] - lo) * scale
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def hs_features(hsv_frame, boxes, out):
+        """
+        프레임의 모든 ROI에 대해 Re-ID 특징 벡터를 한 번의 호출로 계산
+        - boxes: (N, 4) int32 [x1, y1, x2, y2] (프레임 범위로 clamp된 유효 박스)
+        - out: (N, H_BINS * S_BINS) float32, 행 k = ROI k의 히스토그램(NORM_MINMAX)을 평균 제거 + L2 정규화한 벡터
+        ROI마다 Python -> 커널 호출을 반복하지 않도록 객체 루프 전체를 커널 안에서 수행
+        """
+        hist = np.empty((H_BINS, S_BINS), dtype=np.float32)
+        dim = H_BINS * S_BINS
+        for k in range(boxes.shape[0]):
+            x1, y1, x2, y2 = boxes[k, 0], boxes[k, 1], boxes[k, 2], boxes[k, 3]
+            hs_hist(hsv_frame[y1:y2, x1:x2], hist)
+
+            mean = 0.0
+            for i in range(H_BINS):
+                for j in range(S_BINS):
+                    mean += hist[i, j]
+            mean /= dim
+
+            sq = 0.0
+            for i in range(H_BINS):
+                for j in range(S_BINS):
+                    v = hist[i, j] - mean
+                    out[k, i * S_BINS + j] = v
+                    sq += v * v
+
+            if sq > 0:
+                inv = 1.0 / np.sqrt(sq)
+                for d in range(dim):
+                    out[k, d] *= inv
+        return out
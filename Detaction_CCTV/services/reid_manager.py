@@ -1,14 +1,24 @@
+import time
+
 import cv2
 import numpy as np
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple
+
+from . import reid_kernels
+from .detections import Detections
 
 class ReIDManager:
     """
     객체의 외형(히스토그램)을 저장하여, 화면 밖으로 나갔다 돌아와도
     기존 ID를 다시 부여해주는 재식별(Re-Identification) 관리자
     """
-    def __init__(self, similarity_threshold: float = 0.70):
-        # 영구 ID 관리: { permanent_id: {'hist': histogram, 'last_seen': time, 'name': 'Person X'} }
+    FEATURE_DIM = reid_kernels.H_BINS * reid_kernels.S_BINS  # H(16) x S(16) 히스토그램
+    INITIAL_CAPACITY = 64
+    MAX_DETECTIONS = 64  # 프레임당 스크래치 버퍼 초기 크기 (초과 시 확장)
+
+    def __init__(self, similarity_threshold: float = 0.70, ttl_seconds: float = 300.0):
+        # 영구 ID 관리: { permanent_id: {'row': 특징 행렬의 행 번호, 'name': 'Person X'} }
+        # (마지막 관측 시각은 행 단위 배열 _last_seen에 보관)
         self.known_objects: Dict[int, Dict] = {}
         
         # 현재 YOLO ID와 영구 ID 매핑: { yolo_track_id: permanent_id }
@@ -16,77 +26,170 @@ class ReIDManager:
         
         self.next_uid = 1  # 부여할 영구 ID 번호
         self.threshold = similarity_threshold
+        # 이 시간(초) 동안 관측되지 않은 영구 ID는 삭제 (Re-ID 비교 대상/메모리가 무한히 늘지 않도록)
+        self.ttl_seconds = ttl_seconds
+
+        # 유사도 계산용 특징 행렬: 행 i = 평균 제거 + L2 정규화된 히스토그램 (HISTCMP_CORREL == 내적)
+        # 모든 known_objects와의 비교를 한 번의 행렬-벡터 곱(BLAS GEMV)으로 처리
+        self._hist_matrix = np.zeros((self.INITIAL_CAPACITY, self.FEATURE_DIM), dtype=np.float32)
+        self._perm_ids = np.zeros(self.INITIAL_CAPACITY, dtype=np.int64)  # 행 -> 영구 ID
+        self._last_seen = np.zeros(self.INITIAL_CAPACITY, dtype=np.float64)  # 행 -> 마지막 관측 시각 (monotonic)
+        self._num_rows = 0
+
+        # 프레임마다 재사용하는 스크래치 버퍼 (update_ids 밖으로 나가지 않는 중간 결과 전용)
+        self._box_buf = np.empty((self.MAX_DETECTIONS, 4), dtype=np.float32)
+        self._box_i_buf = np.empty((self.MAX_DETECTIONS, 4), dtype=np.int32)
+        self._feature_buf = np.empty((self.MAX_DETECTIONS, self.FEATURE_DIM), dtype=np.float32)
+
+    def _ensure_scratch(self, n: int) -> None:
+        """스크래치 버퍼가 n개 객체를 담을 수 있도록 확장 (2배씩)"""
+        capacity = len(self._box_buf)
+        if n <= capacity:
+            return
+        while capacity < n:
+            capacity *= 2
+        self._box_buf = np.empty((capacity, 4), dtype=np.float32)
+        self._box_i_buf = np.empty((capacity, 4), dtype=np.int32)
+        self._feature_buf = np.empty((capacity, self.FEATURE_DIM), dtype=np.float32)
+
+    def _compute_features(self, hsv_frame, boxes: np.ndarray) -> np.ndarray:
+        """
+        유효 박스(N, 4 int32) 각각의 ROI에서 특징 벡터를 계산해 (N, FEATURE_DIM) 배열로 반환
+        numba가 있으면 모든 ROI를 한 번의 커널 호출로 처리
+        (반환값은 스크래치 버퍼의 view이므로 다음 호출 전까지만 유효)
+        """
+        features = self._feature_buf[:len(boxes)]
+        if len(boxes) == 0:
+            # 객체가 없는 프레임은 hsv_frame이 None으로 전달되므로 커널 호출 없이 빈 결과 반환
+            return features
+        if reid_kernels.HAS_NUMBA:
+            return reid_kernels.hs_features(hsv_frame, boxes, features)
+
+        for k, (x1, y1, x2, y2) in enumerate(boxes.tolist()):
+            # 이미지 자르기 (Slicing)
+            features[k] = self._to_feature(self._calculate_histogram(hsv_frame[y1:y2, x1:x2]))
+        return features
 
-    def _calculate_histogram(self, image_crop):
-        """이미지 조각에서 색상 분포(Fingerprint) 추출"""
-        hsv = cv2.cvtColor(image_crop, cv2.COLOR_BGR2HSV)
+    def _calculate_histogram(self, hsv_crop):
+        """HSV 이미지 조각에서 색상 분포(Fingerprint) 추출 (색공간 변환은 프레임 단위로 미리 수행)"""
         # Hue(색상)와 Saturation(채도)만 사용 (조명 변화 영향 최소화)
-        hist = cv2.calcHist([hsv], [0, 1], None, [16, 16], [0, 180, 0, 256])
+        hist = cv2.calcHist([hsv_crop], [0, 1], None, [16, 16], [0, 180, 0, 256])
         cv2.normalize(hist, hist, 0, 1, cv2.NORM_MINMAX)
         return hist
 
-    def update_ids(self, frame, yolo_objects: List[Dict]) -> List[Dict]:
+    def _to_feature(self, hist) -> np.ndarray:
+        """히스토그램을 평균 제거 + L2 정규화한 벡터로 변환 (두 벡터의 내적 = 상관계수)"""
+        vec = hist.reshape(-1).astype(np.float32)
+        vec -= vec.mean()
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec /= norm
+        return vec
+
+    def _set_feature(self, perm_id: int, feature: np.ndarray, now: float) -> None:
+        """영구 ID의 특징 벡터와 관측 시각을 기록 (신규 ID면 행 추가)"""
+        row = self.known_objects[perm_id].get('row')
+        if row is None:
+            if self._num_rows == len(self._hist_matrix):
+                # 용량 부족 시 2배로 확장 (추가 비용 분할 상환)
+                self._hist_matrix = np.resize(self._hist_matrix, (2 * len(self._hist_matrix), self.FEATURE_DIM))
+                self._perm_ids = np.resize(self._perm_ids, 2 * len(self._perm_ids))
+                self._last_seen = np.resize(self._last_seen, 2 * len(self._last_seen))
+            row = self._num_rows
+            self._num_rows += 1
+            self._perm_ids[row] = perm_id
+            self.known_objects[perm_id]['row'] = row
+        self._hist_matrix[row] = feature
+        self._last_seen[row] = now
+
+    def _evict_stale(self, now: float) -> None:
+        """TTL 동안 관측되지 않은 영구 ID를 삭제하고, 남은 행을 앞으로 모아 행렬을 재구성"""
+        n = self._num_rows
+        keep = (now - self._last_seen[:n]) < self.ttl_seconds
+        if keep.all():
+            return
+
+        for perm_id in self._perm_ids[:n][~keep].tolist():
+            del self.known_objects[perm_id]
+
+        kept_rows = np.flatnonzero(keep)
+        m = len(kept_rows)
+        self._hist_matrix[:m] = self._hist_matrix[kept_rows]
+        self._perm_ids[:m] = self._perm_ids[kept_rows]
+        self._last_seen[:m] = self._last_seen[kept_rows]
+        self._num_rows = m
+        for row, perm_id in enumerate(self._perm_ids[:m].tolist()):
+            self.known_objects[perm_id]['row'] = row
+
+        # 삭제된 영구 ID를 가리키는 매핑도 정리
+        self.id_map = {k: v for k, v in self.id_map.items() if v in self.known_objects}
+
+    def _find_best_match(self, feature: np.ndarray) -> Tuple[int, float]:
+        """현재 화면에 없는 known_objects 중 가장 유사한 영구 ID와 점수 반환"""
+        n = self._num_rows
+        # 현재 화면에 있는 사람의 행 (비교 대상에서 제외)
+        active_rows = [self.known_objects[perm_id]['row'] for perm_id in set(self.id_map.values())]
+        if n - len(active_rows) <= 0:
+            # 화면 밖 후보가 없으면 행렬 연산 없이 종료
+            return -1, -1.0
+
+        scores = self._hist_matrix[:n] @ feature
+        scores[active_rows] = -np.inf
+
+        best_row = int(np.argmax(scores))
+        if not np.isfinite(scores[best_row]):
+            return -1, -1.0
+        return int(self._perm_ids[best_row]), float(scores[best_row])
+
+    def update_ids(self, frame, hsv_frame, detections: Detections) -> Detections:
         """
-        YOLO가 감지한 객체 리스트를 받아, 영구 ID(Permanent ID)로 변환하여 반환
+        YOLO가 감지한 객체들을 받아, 영구 ID(Permanent ID)를 부여한 Detections로 반환
+        (박스는 화면 범위로 clamp된 정수 좌표, 유효하지 않은 박스는 제외)
+        hsv_frame: frame을 HSV로 한 번 변환한 이미지 (ROI마다 cvtColor를 호출하지 않도록 슬라이스만 사용)
         """
-        current_yolo_ids = set()
-        processed_objects = []
+        now = time.monotonic()
+        yolo_ids = detections.ids.tolist()
+        current_yolo_ids = set(yolo_ids)
         
         # 화면 크기 가져오기 (좌표 벗어남 방지용)
         frame_h, frame_w = frame.shape[:2]
 
-        for obj in yolo_objects:
-            yolo_id = obj['id']
-            box = obj['box']
-            current_yolo_ids.add(yolo_id)
-            
-            # [수정] 좌표를 정수(int)로 변환하고 화면 범위 내로 제한(Clamping)
-            # 이렇게 해야 TypeError: slice indices must be integers 오류가 사라집니다.
-            x1 = int(max(0, box[0]))
-            y1 = int(max(0, box[1]))
-            x2 = int(min(frame_w, box[2]))
-            y2 = int(min(frame_h, box[3]))
-
-            # 유효하지 않은 박스(크기가 0이거나 음수)는 건너뜀
-            if x2 <= x1 or y2 <= y1:
-                continue
-            
-            # 이미지 자르기 (Slicing)
-            person_roi = frame[y1:y2, x1:x2]
-            
-            if person_roi.size == 0: 
-                continue
-            
-            current_hist = self._calculate_histogram(person_roi)
+        # [수정] 좌표를 정수(int)로 변환하고 화면 범위 내로 제한(Clamping)
+        # 이렇게 해야 TypeError: slice indices must be integers 오류가 사라집니다.
+        # 모든 박스를 한 번에 clip (객체마다 int(max(...)) 4회 호출하던 부분)
+        # (clip/정수 변환 결과는 스크래치 버퍼에 기록해 프레임마다 새 배열을 만들지 않음)
+        n = len(detections)
+        self._ensure_scratch(n)
+        boxes_f = np.clip(detections.boxes, 0, [frame_w, frame_h, frame_w, frame_h], out=self._box_buf[:n])
+        boxes_i = self._box_i_buf[:n]
+        np.copyto(boxes_i, boxes_f, casting='unsafe')
+
+        # 유효하지 않은 박스(크기가 0이거나 음수)는 건너뜀
+        valid = np.flatnonzero((boxes_i[:, 2] > boxes_i[:, 0]) & (boxes_i[:, 3] > boxes_i[:, 1]))
+        valid_boxes = boxes_i[valid]
+        features = self._compute_features(hsv_frame, valid_boxes)
+        perm_ids = np.empty(len(valid), dtype=np.int64)
+        names = []
+
+        for out_idx, i in enumerate(valid.tolist()):
+            yolo_id = yolo_ids[i]
+            feature = features[out_idx]
 
             # 1. 이미 매핑된 YOLO ID인가? (화면 내에서 계속 추적 중)
             if yolo_id in self.id_map:
                 perm_id = self.id_map[yolo_id]
-                self.known_objects[perm_id]['hist'] = current_hist
+                self._set_feature(perm_id, feature, now)
             
             else:
                 # 2. 새로운 YOLO ID 등장 -> 과거의 누군가인지 검색 (Re-ID)
-                found_match = False
-                best_score = -1.0
-                matched_perm_id = -1
-
-                for perm_id, data in self.known_objects.items():
-                    # 현재 화면에 없는 사람하고만 비교
-                    if perm_id in self.id_map.values():
-                        continue
-                        
-                    # 히스토그램 유사도 비교
-                    score = cv2.compareHist(data['hist'], current_hist, cv2.HISTCMP_CORREL)
-                    
-                    if score > best_score:
-                        best_score = score
-                        matched_perm_id = perm_id
+                # 히스토그램 유사도 비교 (모든 후보를 한 번에 계산)
+                matched_perm_id, best_score = self._find_best_match(feature)
 
                 # 유사도가 임계값 이상이면 -> "아까 그 사람이다!"
                 if best_score > self.threshold:
                     perm_id = matched_perm_id
                     self.id_map[yolo_id] = perm_id
-                    self.known_objects[perm_id]['hist'] = current_hist
+                    self._set_feature(perm_id, feature, now)
                     # print(f"🔄 Re-ID Success: YOLO {yolo_id} -> Person {perm_id} ({best_score:.2f})")
                 else:
                     # 3. 정말 새로운 사람 -> 신규 ID 발급
@@ -94,18 +197,19 @@ class ReIDManager:
                     self.next_uid += 1
                     self.id_map[yolo_id] = perm_id
                     self.known_objects[perm_id] = {
-                        'hist': current_hist,
                         'name': f"Person {perm_id}"
                     }
+                    self._set_feature(perm_id, feature, now)
 
-            # 결과 객체에 영구 ID 정보 주입
-            obj['permanent_id'] = perm_id
-            obj['name'] = self.known_objects[perm_id]['name']
-            
-            # 박스 좌표도 정수형으로 업데이트해줌 (화면 그리기용)
-            obj['box'] = [x1, y1, x2, y2]
-            
-            processed_objects.append(obj)
+            # 결과에 영구 ID 정보 주입
+            perm_ids[out_idx] = perm_id
+            names.append(self.known_objects[perm_id]['name'])
+
+        # 유효한 객체만 남기고, 박스 좌표도 정수형으로 교체 (화면 그리기용)
+        processed = detections.filter(valid)
+        processed.boxes = valid_boxes
+        processed.perm_ids = perm_ids
+        processed.names = names
 
         # 화면에서 사라진 YOLO ID는 매핑에서 제거
         active_yolo_ids = list(self.id_map.keys())
@@ -113,4 +217,7 @@ class ReIDManager:
             if old_id not in current_yolo_ids:
                 del self.id_map[old_id]
 
-        return processed_objects
\ No newline at end of file
+        # 오래 보이지 않은 영구 ID 정리
+        self._evict_stale(now)
+
+        return processed
\ No newline at end of file
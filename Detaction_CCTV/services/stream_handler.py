@@ -1,4 +1,5 @@
 import cv2
+import queue
 import threading
 import os
 import time
@@ -7,14 +8,16 @@ import numpy as np
 
 class VideoStreamHandler:
     def __init__(self, source_url: str):
-        # TCP 전송 강제 (패킷 손실 방지)
-        os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp"
+        # TCP 전송 강제 (패킷 손실 방지) + 디코더 버퍼링 비활성화 (지연 누적 방지)
+        os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp|fflags;nobuffer|flags;low_delay"
         self.source_url = source_url
-        self.capture = cv2.VideoCapture(self.source_url)
+        # 네트워크 스트림은 grab()이 다음 패킷까지 블로킹되므로 별도의 sleep이 필요 없음
+        self._is_live: bool = str(source_url).startswith(("rtsp://", "rtmp://", "http://", "https://"))
+        self.capture = self._open_capture()
 
         self.is_running: bool = False
-        self.current_frame: Optional[np.ndarray] = None
-        self._lock = threading.Lock()
+        # 크기 1의 최신 프레임 슬롯: 소비자가 느리면 이전 프레임은 버려짐 (head-of-line 지연 제거)
+        self._frames: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=1)
         self.thread = None  # [추가] 스레드 객체를 저장할 변수
         
         if self.capture.isOpened():
@@ -39,27 +42,45 @@ class VideoStreamHandler:
                 self._reconnect()
                 continue
                 
-            # 2. 프레임 읽기
-            grabbed, frame = self.capture.read()
+            # 2. 프레임 읽기 (grab: 패킷 수신/디코딩, retrieve: BGR 변환)
+            grabbed = self.capture.grab()
+            frame = None
+            if grabbed:
+                grabbed, frame = self.capture.retrieve()
             
             if grabbed:
-                with self._lock:
-                    self.current_frame = frame
+                # drop-oldest: 아직 소비되지 않은 이전 프레임을 비우고 최신 프레임만 보관
+                try:
+                    self._frames.get_nowait()
+                except queue.Empty:
+                    pass
+                self._frames.put_nowait(frame)
             else:
                 print("[Stream] Signal lost. Reconnecting...")
                 self._reconnect()
             
             # [추가] CPU 점유율 폭주 방지 (Mac 과부하 방지)
-            time.sleep(0.01)
+            # 라이브 스트림에서는 매 프레임 sleep이 FFmpeg 내부 큐를 쌓이게 하므로 파일 등 로컬 소스에서만 적용
+            if not self._is_live:
+                time.sleep(0.01)
+
+    def _open_capture(self) -> cv2.VideoCapture:
+        capture = cv2.VideoCapture(self.source_url, cv2.CAP_FFMPEG)
+        # 백엔드가 지원하면 내부 프레임 버퍼를 1장으로 제한 (지원하지 않으면 무시됨)
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return capture
 
     def _reconnect(self):
         self.capture.release()
         time.sleep(1)
-        self.capture = cv2.VideoCapture(self.source_url)
+        self.capture = self._open_capture()
 
     def get_frame(self) -> Optional[np.ndarray]:
-        with self._lock:
-            return self.current_frame.copy() if self.current_frame is not None else None
+        """가장 최신 프레임을 꺼내 반환 (이전 호출 이후 새 프레임이 없으면 None)"""
+        try:
+            return self._frames.get_nowait()
+        except queue.Empty:
+            return None
 
     def release(self) -> None:
         """안전한 종료: 스레드가 멈출 때까지 기다린 후 자원 해제"""
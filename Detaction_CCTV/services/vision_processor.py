@@ -1,46 +1,138 @@
-from typing import List, Dict, Tuple
+import os
+from typing import List
+import torch
 from ultralytics import YOLO
 import numpy as np
 
+from .detections import Detections
+
 class VisionProcessor:
-    def __init__(self, model_path: str, confidence: float):
-        print(f"[Vision] Loading AI Model: {model_path}...")
-        self.model = YOLO(model_path)
+    # export 대상 백엔드 -> (Ultralytics export format, 산출물 접미사)
+    EXPORT_BACKENDS = {
+        'openvino': ('openvino', '_openvino_model'),
+        'onnx': ('onnx', '.onnx'),
+        'tensorrt': ('engine', '.engine'),  # NVIDIA GPU 전용 (AI_DEVICE=cuda)
+    }
+    CALIB_FALLBACK_DATA = 'coco8.yaml'  # 보정용 프레임이 없을 때 Ultralytics 기본 데이터셋 사용
+
+    def __init__(self, model_path: str, confidence: float, backend: str = 'pytorch',
+                 int8: bool = False, calib_dir: str = '', imgsz: int = 640, device: str = 'cpu',
+                 batch: int = 1, num_threads: int = 0):
+        print(f"[Vision] Loading AI Model: {model_path} (backend: {backend}{', INT8' if int8 else ''})...")
+        # 추론 입력 크기: 원본 프레임(예: 1080p)은 이 크기로 letterbox 되어 추론되고,
+        # 박스는 원본 좌표로 반환되므로 표시용 프레임은 원본 해상도를 유지
+        self.imgsz = imgsz
+        self.batch = batch  # TensorRT 엔진은 입력 배치 크기가 고정되므로 export 시 사용
+        # 기본은 CPU (Mac 충돌 방지). CUDA GPU에서는 FP16 추론 (메모리 전송량 절반, Tensor Core 사용)
+        self.device = device
+        self.half = device.startswith('cuda') and backend not in self.EXPORT_BACKENDS
+        if device == 'cpu' and num_threads > 0:
+            # 지정된 경우에만 intra-op 스레드 수 제한 (캡처/렌더링 스레드와의 코어 경합 완화)
+            torch.set_num_threads(num_threads)
+        self.model = self._load_model(model_path, backend, int8, calib_dir)
         self.confidence = confidence
         print("[Vision] AI Model Loaded.")
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[List[Dict], np.ndarray]:
+    def _load_model(self, model_path: str, backend: str, int8: bool, calib_dir: str) -> YOLO:
+        """
+        backend가 openvino/onnx/tensorrt면 .pt를 한 번만 export 해두고 그 결과물을 로드
+        (openvino/onnx: oneDNN 커널 + 그래프 퓨전으로 CPU 추론이 PyTorch eager보다 빠름,
+         tensorrt: conv+bn+act 퓨전 + FP16 Tensor Core)
+        """
+        if backend not in self.EXPORT_BACKENDS:
+            return YOLO(model_path)
+
+        export_format, suffix = self.EXPORT_BACKENDS[backend]
+        if export_format == 'engine' and not self.device.startswith('cuda'):
+            print("[Vision] TensorRT backend requires AI_DEVICE=cuda. Falling back to PyTorch.")
+            return YOLO(model_path)
+        # INT8 양자화는 OpenVINO(NNCF)만 지원
+        int8 = int8 and export_format == 'openvino'
+        if int8:
+            suffix = '_int8' + suffix
+        exported_path = os.path.splitext(model_path)[0] + suffix
+
+        if not os.path.exists(exported_path):
+            print(f"[Vision] Exporting model to {backend} (first run only)...")
+            # export된 모델은 입력 크기가 고정되므로 imgsz를 바꾸면 기존 export 결과를 삭제해야 함
+            export_args = {'format': export_format, 'imgsz': self.imgsz}
+            if int8:
+                export_args.update(int8=True, data=self._calibration_data(calib_dir))
+            else:
+                # ONNX FP16은 CPU export 미지원
+                export_args['half'] = export_format in ('openvino', 'engine')
+            if export_format == 'engine':
+                export_args.update(batch=self.batch, device=0)
+            try:
+                exported_path = YOLO(model_path).export(**export_args)
+            except Exception as e:
+                print(f"[Vision] Export failed ({e}). Falling back to PyTorch.")
+                return YOLO(model_path)
+
+        return YOLO(exported_path, task='detect')
+
+    def _calibration_data(self, calib_dir: str) -> str:
+        """
+        INT8 보정용 데이터셋 yaml 경로 반환
+        calib_dir에 카메라 프레임(jpg/png, ~100장)이 있으면 그 폴더를 가리키는 yaml을 생성
+        """
+        if not calib_dir or not os.path.isdir(calib_dir):
+            return self.CALIB_FALLBACK_DATA
+
+        images = [f for f in os.listdir(calib_dir) if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
+        if not images:
+            return self.CALIB_FALLBACK_DATA
+
+        print(f"[Vision] INT8 calibration with {len(images)} frames from {calib_dir}")
+        data_yaml = os.path.join(calib_dir, 'calib.yaml')
+        with open(data_yaml, 'w') as f:
+            f.write(f"path: {os.path.abspath(calib_dir)}\ntrain: .\nval: .\nnames:\n  0: person\n")
+        return data_yaml
+
+    def process_frame(self, frame: np.ndarray) -> Detections:
         """
         [수정사항]
-        1. device='cpu': Mac Bus Error 방지
+        1. device='cpu'(기본값): Mac Bus Error 방지 (AI_DEVICE로 CUDA 사용 시 FP16)
         2. classes=[0]: 사람만 감지 (YOLO COCO 기준 0번=Person)
+        3. results[0].plot() 제거: 오버레이는 main에서 직접 그리므로 프레임 복사 + 박스 그리기 낭비
+        """
+        results = self._track([frame])
+        return self._parse_result(results[0])
+
+    def process_frames(self, frames: List[np.ndarray]) -> List[Detections]:
         """
-        results = self.model.track(
-            frame, 
+        여러 프레임을 한 번의 forward pass로 추론 (배치 처리)
+        프레임별 오버헤드(디스패치, 텐서 할당)가 분산되어 처리량이 증가
+        리스트 입력은 같은 트래커로 순서대로 갱신되므로 persist=True 시 ID가 유지됨
+        """
+        if not frames:
+            return []
+        return [self._parse_result(result) for result in self._track(frames)]
+
+    def _track(self, frames: List[np.ndarray]):
+        return self.model.track(
+            frames, 
             persist=True, 
             conf=self.confidence, 
+            imgsz=self.imgsz,
             verbose=False,
             classes=[0],   # 사람만 추적
-            device='cpu'   # [중요] Mac 충돌 방지용 CPU 강제
+            device=self.device,  # [중요] 기본값 'cpu': Mac 충돌 방지
+            half=self.half
+        )
+
+    def _parse_result(self, result) -> Detections:
+        if result.boxes.id is None:
+            return Detections.empty()
+
+        # CPU로 텐서를 이동시킨 후 Numpy 변환
+        # boxes.data는 [x1, y1, x2, y2, id, conf, cls]를 담은 하나의 텐서이므로
+        # xyxy/id/cls를 따로 변환(장치->호스트 복사 3회)하지 않고 한 번에 가져와 CPU에서 슬라이스
+        data = result.boxes.data.cpu().numpy()
+        boxes = data[:, :4]
+        return Detections(
+            boxes=boxes,  # [x1, y1, x2, y2]
+            ids=data[:, 4].astype(int),
+            clss=data[:, -1].astype(int),
+            centers=(boxes[:, :2] + boxes[:, 2:]) / 2,
         )
-        
-        # main.py에서 "raw_objects, _ = ..."로 받으므로 튜플 형태 유지
-        annotated_frame = results[0].plot()
-        
-        detected_objects = []
-        
-        if results[0].boxes.id is not None:
-            # CPU로 텐서를 이동시킨 후 Numpy 변환
-            boxes = results[0].boxes.xyxy.cpu().numpy()
-            ids = results[0].boxes.id.cpu().numpy().astype(int)
-            clss = results[0].boxes.cls.cpu().numpy().astype(int)
-
-            for box, track_id, cls_id in zip(boxes, ids, clss):
-                detected_objects.append({
-                    'id': track_id,
-                    'cls': cls_id,
-                    'box': box.tolist(),  # [x1, y1, x2, y2]
-                    'center': ((box[0] + box[2]) / 2, (box[1] + box[3]) / 2)
-                })
-                
-        return detected_objects, annotated_frame
\ No newline at end of file
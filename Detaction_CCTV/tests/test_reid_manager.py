@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""ReIDManager 회귀 테스트 (카메라/모델 없이 실행 가능)"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+
+# services/__init__.py는 ONVIF/YOLO 등 하드웨어 의존 모듈까지 임포트하므로,
+# 패키지 초기화 없이 services 하위 모듈만 로드할 수 있도록 패키지 경로만 등록
+SERVICES_DIR = Path(__file__).resolve().parent.parent / 'services'
+if 'services' not in sys.modules:
+    package = types.ModuleType('services')
+    package.__path__ = [str(SERVICES_DIR)]
+    sys.modules['services'] = package
+
+from services.detections import Detections  # noqa: E402
+from services.reid_manager import ReIDManager  # noqa: E402
+
+
+def _detections(boxes, ids) -> Detections:
+    boxes = np.asarray(boxes, dtype=np.float32)
+    return Detections(
+        boxes=boxes,
+        ids=np.asarray(ids, dtype=np.int64),
+        clss=np.zeros(len(ids), dtype=np.int64),
+        centers=(boxes[:, :2] + boxes[:, 2:]) / 2,
+    )
+
+
+def test_update_ids_empty_frame_without_hsv():
+    # InferenceWorker는 객체가 없는 프레임에 hsv_frame=None을 넘김
+    manager = ReIDManager()
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    result = manager.update_ids(frame, None, Detections.empty())
+
+    assert len(result) == 0
+    assert len(result.perm_ids) == 0
+
+
+def test_update_ids_clears_mapping_after_target_leaves():
+    manager = ReIDManager()
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+    hsv_frame = frame.copy()
+
+    first = manager.update_ids(frame, hsv_frame, _detections([[10, 10, 60, 100]], [7]))
+    assert first.perm_ids.tolist() == [1]
+    assert manager.id_map == {7: 1}
+
+    empty = manager.update_ids(frame, None, Detections.empty())
+    assert len(empty) == 0
+    assert manager.id_map == {}
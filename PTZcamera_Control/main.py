@@ -1,6 +1,6 @@
 from monitoring import run_monitoring
 from ptz_controller import PTZCameraController
-from settings import configure_opencv_rtsp_tcp, load_settings
+from settings import configure_opencv_rtsp_tcp, load_settings, resolve_gst_pipeline
 from yolo_detector import YoloConfig, YoloDetector
 
 
@@ -14,6 +14,14 @@ def main():
             model_path=settings.model_path,
             conf_threshold=settings.conf_threshold,
             tracker_cfg_name=settings.tracker_cfg_name,
+            backend=settings.backend,
+            engine_path=settings.engine_path,
+            onnx_path=settings.onnx_path,
+            batch_size=settings.batch_size,
+            imgsz=settings.imgsz,
+            int8=settings.int8,
+            calib_dir=settings.calib_dir,
+            num_threads=settings.num_threads,
         )
     )
     print("YOLO model loaded successfully!")
@@ -36,6 +44,9 @@ def main():
         ptz_controller=ptz_controller,
         window_name=settings.window_name,
         skip_frames=settings.skip_frames,
+        batch_size=settings.batch_size,
+        gst_pipeline=resolve_gst_pipeline(settings.rtsp_gst_pipeline, settings.rtsp_url),
+        imgsz=settings.imgsz,
     )
 
 
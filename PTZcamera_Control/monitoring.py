@@ -1,6 +1,46 @@
+import queue
+import re
+import threading
 import time
 
 import cv2
+import numpy as np
+
+
+READ_QUEUE_SIZE = 2
+_STREAM_END = None
+
+
+def _build_class_colors(num_classes=80):
+    # Golden-ratio hue steps keep neighbouring class ids visually distinct;
+    # converted to BGR once and indexed by class id.
+    hues = (np.arange(num_classes) * 0.618034 * 180 % 180).astype(np.uint8)
+    hsv = np.stack([hues, np.full_like(hues, 220), np.full_like(hues, 255)], axis=1)
+    return cv2.cvtColor(hsv[None], cv2.COLOR_HSV2BGR)[0]
+
+
+_CLASS_COLORS = _build_class_colors()
+_HAS_GSTREAMER = re.search(r"GStreamer:\s*YES", cv2.getBuildInformation()) is not None
+_HAS_OPENCL = cv2.ocl.haveOpenCL()
+
+
+def _open_capture(rtsp_url, gst_pipeline):
+    # Prefer the GStreamer hardware-decode pipeline when configured and
+    # available; otherwise use OpenCV's default FFmpeg (software) decode.
+    if gst_pipeline:
+        if _HAS_GSTREAMER:
+            video_capture = cv2.VideoCapture(gst_pipeline, cv2.CAP_GSTREAMER)
+            if video_capture.isOpened():
+                print("Video decode: GStreamer pipeline")
+                return video_capture
+            video_capture.release()
+            print("GStreamer pipeline failed to open -> fallback to FFmpeg")
+        else:
+            print("OpenCV built without GStreamer -> fallback to FFmpeg")
+    video_capture = cv2.VideoCapture(rtsp_url)
+    # Keep at most one decoded frame queued inside the backend (ignored where unsupported).
+    video_capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return video_capture
 
 
 def _handle_key(key_code, ptz_controller) -> bool:
@@ -19,14 +59,137 @@ def _handle_key(key_code, ptz_controller) -> bool:
     return True
 
 
-def run_monitoring(rtsp_url, detector, ptz_controller, window_name, skip_frames):
+def _reader(video_capture, read_queue, stop_event):
+    # Decode on a separate thread so network/decode overlaps with inference.
+    # When the queue is full the oldest frame is dropped to keep latency low.
+    # The capture is released here, never while a read() may still be in flight.
+    try:
+        while not stop_event.is_set():
+            is_frame_read, frame = video_capture.read()
+            if not is_frame_read:
+                frame = _STREAM_END
+            try:
+                read_queue.put_nowait(frame)
+            except queue.Full:
+                try:
+                    read_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                read_queue.put_nowait(frame)
+            if frame is _STREAM_END:
+                return
+    finally:
+        video_capture.release()
+
+
+def _console_writer(messages):
+    # Print status lines off the frame loop, so a slow or blocked stdout
+    # (pipe, remote terminal) never stalls rendering. None ends the thread.
+    while True:
+        message = messages.get()
+        if message is None:
+            return
+        print(message)
+
+
+class _FpsLabel:
+    # Renders the FPS text into an alpha mask only when the string changes
+    # (once per second) and alpha-blends it onto each frame; cheaper than
+    # rasterizing anti-aliased glyphs with putText on every frame.
+    ORIGIN = (10, 30)
+    FONT = cv2.FONT_HERSHEY_SIMPLEX
+    SCALE = 0.9
+    COLOR = (0, 255, 0)
+    THICKNESS = 2
+
+    def __init__(self):
+        self._text = None
+        self._inv_alpha = None
+        self._color = None
+
+    def update(self, text):
+        if text == self._text:
+            return
+        self._text = text
+        (text_w, _), baseline = cv2.getTextSize(text, self.FONT, self.SCALE, self.THICKNESS)
+        height = self.ORIGIN[1] + baseline + self.THICKNESS
+        width = self.ORIGIN[0] + text_w + self.THICKNESS
+        mask = np.zeros((height, width), np.uint8)
+        cv2.putText(mask, text, self.ORIGIN, self.FONT, self.SCALE, 255, self.THICKNESS, cv2.LINE_AA)
+        alpha = cv2.merge([mask, mask, mask])
+        self._inv_alpha = 255 - alpha
+        self._color = cv2.multiply(np.full(alpha.shape, self.COLOR, np.uint8), alpha, scale=1 / 255.0)
+
+    def draw(self, frame):
+        height = min(self._inv_alpha.shape[0], frame.shape[0])
+        width = min(self._inv_alpha.shape[1], frame.shape[1])
+        roi = frame[:height, :width]
+        background = cv2.multiply(roi, self._inv_alpha[:height, :width], scale=1 / 255.0)
+        cv2.add(background, self._color[:height, :width], dst=roi)
+        return frame
+
+
+def _resize_for_inference(frame, imgsz):
+    # Shrink the frame so its long side matches the model input size; YOLO's
+    # letterbox then only pads instead of resizing the full-resolution frame.
+    # Runs through OpenCL (T-API) when available. Returns (frame, scale).
+    height, width = frame.shape[:2]
+    scale = imgsz / max(height, width)
+    if scale >= 1.0:
+        return frame, 1.0
+    size = (round(width * scale), round(height * scale))
+    if _HAS_OPENCL:
+        return cv2.resize(cv2.UMat(frame), size, interpolation=cv2.INTER_LINEAR).get(), scale
+    return cv2.resize(frame, size, interpolation=cv2.INTER_LINEAR), scale
+
+
+def _extract_detections(result, scale=1.0):
+    # Boxes.data holds [x1, y1, x2, y2, (track id), conf, cls] in one tensor,
+    # so a single transfer replaces separate xyxy/id/conf/cls conversions.
+    data = result.boxes.data.cpu().numpy()
+    # Map boxes from the inference frame back to display resolution.
+    boxes = (data[:, :4] / scale).astype(np.int32) if scale != 1.0 else data[:, :4].astype(np.int32)
+    ids = data[:, 4].astype(np.int64) if result.boxes.is_track else None
+    confs = data[:, -2]
+    clss = data[:, -1].astype(np.int64)
+    return boxes, ids, confs, clss, result.names
+
+
+def _draw_detections(frame, detections):
+    # Draw the cached detections onto the current frame in place
+    # (replaces results[0].plot(), which copied and redrew the inferred frame).
+    boxes, ids, confs, clss, names = detections
+    colors = _CLASS_COLORS[clss % len(_CLASS_COLORS)].tolist()
+    id_list = ids.tolist() if ids is not None else [None] * len(boxes)
+    for (x1, y1, x2, y2), track_id, conf, cls, color in zip(
+        boxes.tolist(), id_list, confs.tolist(), clss.tolist(), colors
+    ):
+        label = f"{names.get(cls, cls)} {conf:.2f}"
+        if track_id is not None:
+            label = f"id:{track_id} {label}"
+        cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+        cv2.putText(frame, label, (x1, max(y1 - 5, 10)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1, cv2.LINE_AA)
+    return frame
+
+
+def run_monitoring(
+    rtsp_url,
+    detector,
+    ptz_controller,
+    window_name,
+    skip_frames,
+    batch_size=1,
+    gst_pipeline=None,
+    imgsz=640,
+):
     if not rtsp_url:
         print("Error: RTSP_URL is not set.")
         return
 
     skip_frames = max(1, int(skip_frames))
+    batch_size = max(1, int(batch_size))
 
-    video_capture = cv2.VideoCapture(rtsp_url)
+    video_capture = _open_capture(rtsp_url, gst_pipeline)
     if not video_capture.isOpened():
         print("Error: Cannot open video stream.")
         video_capture.release()
@@ -35,22 +198,45 @@ def run_monitoring(rtsp_url, detector, ptz_controller, window_name, skip_frames)
     cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
     print("Controls: [W/A/S/D] Move, [Space] Stop, [Q] Quit")
     print(f"YOLO detection: Every {skip_frames} frames (for better performance)")
+    if batch_size > 1:
+        print(f"YOLO batch: {batch_size} frames per forward pass")
 
-    frame_count = 0
-    last_results = None
+    frames_until_infer = skip_frames
+    last_detections = None
+    pending_frames = []
+    infer_scale = 1.0
     fps = 0.0
     frames_since_last = 0
     last_fps_time = time.perf_counter()
+    fps_label = _FpsLabel()
+    fps_label.update(f"FPS: {fps:.1f}")
+
+    read_queue = queue.Queue(maxsize=READ_QUEUE_SIZE)
+    stop_event = threading.Event()
+    reader_thread = threading.Thread(
+        target=_reader, args=(video_capture, read_queue, stop_event), daemon=True
+    )
+    reader_thread.start()
+    console_messages = queue.SimpleQueue()
+    console_thread = threading.Thread(target=_console_writer, args=(console_messages,), daemon=True)
+    console_thread.start()
 
     try:
         while True:
-            is_frame_read, frame = video_capture.read()
+            try:
+                frame = read_queue.get(timeout=0.1)
+            except queue.Empty:
+                # Keep the window and PTZ keys responsive while waiting for a frame.
+                key_code = cv2.waitKey(1) & 0xFF
+                if not _handle_key(key_code, ptz_controller):
+                    break
+                continue
 
-            if not is_frame_read:
+            if frame is _STREAM_END:
                 print("Video stream disconnected.")
                 break
 
-            frame_count += 1
+            frames_until_infer -= 1
             frames_since_last += 1
             fps_updated = False
             now = time.perf_counter()
@@ -61,26 +247,25 @@ def run_monitoring(rtsp_url, detector, ptz_controller, window_name, skip_frames)
                 last_fps_time = now
                 fps_updated = True
 
-            if frame_count % skip_frames == 0:
-                last_results = detector.infer(frame)
+            if frames_until_infer == 0:
+                frames_until_infer = skip_frames
+                small_frame, infer_scale = _resize_for_inference(frame, imgsz)
+                pending_frames.append(small_frame)
+                if len(pending_frames) >= batch_size:
+                    # Show the newest frame's result; earlier ones still update the tracker.
+                    last_detections = _extract_detections(detector.infer(pending_frames)[-1], infer_scale)
+                    pending_frames = []
 
-            if last_results is not None:
-                annotated_frame = last_results[0].plot()
+            if last_detections is not None:
+                annotated_frame = _draw_detections(frame, last_detections)
             else:
                 annotated_frame = frame
 
-            cv2.putText(
-                annotated_frame,
-                f"FPS: {fps:.1f}",
-                (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.9,
-                (0, 255, 0),
-                2,
-                cv2.LINE_AA,
-            )
             if fps_updated:
-                print(f"FPS: {fps:.1f}")
+                fps_text = f"FPS: {fps:.1f}"
+                fps_label.update(fps_text)
+                console_messages.put(fps_text)
+            fps_label.draw(annotated_frame)
 
             cv2.imshow(window_name, annotated_frame)
 
@@ -88,6 +273,10 @@ def run_monitoring(rtsp_url, detector, ptz_controller, window_name, skip_frames)
             if not _handle_key(key_code, ptz_controller):
                 break
     finally:
+        stop_event.set()
+        reader_thread.join(timeout=1.0)
+        console_messages.put(None)
+        console_thread.join(timeout=1.0)
         ptz_controller.stop_move()
-        video_capture.release()
+        ptz_controller.close()
         cv2.destroyAllWindows()
@@ -1,3 +1,4 @@
+import atexit
 import threading
 
 from onvif import ONVIFCamera
@@ -5,6 +6,12 @@ from onvif import ONVIFCamera
 
 class PTZCameraController:
     def __init__(self, ip, port, user, password):
+        # Latest pending command (a callable); newer commands replace unsent ones.
+        self._pending_cmd = None
+        self._cmd_cond = threading.Condition()
+        self._closed = False
+        self._worker_thread = None
+
         try:
             self.cam = ONVIFCamera(ip, port, user, password)
             self.ptz_service = self.cam.create_ptz_service()
@@ -14,6 +21,10 @@ class PTZCameraController:
 
             self.move_request = self.ptz_service.create_type("ContinuousMove")
             self.move_request.ProfileToken = self.profile_token
+            # Build the Velocity structure and stop request once; commands only update values.
+            self._pan_tilt = {"x": 0.0, "y": 0.0}
+            self.move_request.Velocity = {"PanTilt": self._pan_tilt, "Zoom": {"x": 0.0}}
+            self._stop_request = {"ProfileToken": self.profile_token}
 
             self.is_connected = True
             print("PTZ Camera Connected Successfully.")
@@ -21,8 +32,38 @@ class PTZCameraController:
             print(f"Connection Error: {exc}")
             self.is_connected = False
 
+        if self.is_connected:
+            # One long-lived worker sends commands in order instead of a thread per call.
+            self._worker_thread = threading.Thread(target=self._worker, daemon=True)
+            self._worker_thread.start()
+            # Make sure the last queued command (usually Stop) reaches the camera before exit.
+            atexit.register(self.close)
+
+    def _worker(self):
+        while True:
+            with self._cmd_cond:
+                while self._pending_cmd is None and not self._closed:
+                    self._cmd_cond.wait()
+                if self._pending_cmd is None:
+                    return
+                cmd, self._pending_cmd = self._pending_cmd, None
+            cmd()
+
+    def close(self, timeout=5.0):
+        # Flush: the worker sends any pending command, then exits.
+        with self._cmd_cond:
+            self._closed = True
+            self._cmd_cond.notify()
+        if self._worker_thread is not None and self._worker_thread is not threading.current_thread():
+            self._worker_thread.join(timeout)
+
     def _execute_async(self, func):
-        threading.Thread(target=func).start()
+        # Coalesce: a command still waiting to be sent is superseded by the newest one.
+        with self._cmd_cond:
+            if self._closed:
+                return
+            self._pending_cmd = func
+            self._cmd_cond.notify()
 
     def start_continuous_move(self, pan_velocity, tilt_velocity):
         if not self.is_connected:
@@ -30,10 +71,8 @@ class PTZCameraController:
 
         def send_move_command():
             try:
-                self.move_request.Velocity = {
-                    "PanTilt": {"x": pan_velocity, "y": tilt_velocity},
-                    "Zoom": {"x": 0.0},
-                }
+                self._pan_tilt["x"] = pan_velocity
+                self._pan_tilt["y"] = tilt_velocity
                 self.ptz_service.ContinuousMove(self.move_request)
             except Exception as exc:
                 print(f"Move Error: {exc}")
@@ -46,7 +85,7 @@ class PTZCameraController:
 
         def send_stop_command():
             try:
-                self.ptz_service.Stop({"ProfileToken": self.profile_token})
+                self.ptz_service.Stop(self._stop_request)
             except Exception as exc:
                 print(f"Stop Error: {exc}")
 
@@ -1,4 +1,5 @@
 import os
+import platform
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -10,34 +11,74 @@ _ENV_PATH = Path(__file__).resolve().parent / ".env"
 load_dotenv(dotenv_path=_ENV_PATH)
 
 
+# Hardware-decode pipelines used when RTSP_GST_PIPELINE=auto ({url} is the RTSP URL).
+_GST_PIPELINE_JETSON = (
+    "rtspsrc location={url} latency=0 protocols=tcp ! rtph264depay ! h264parse ! "
+    "nvv4l2decoder ! nvvidconv ! video/x-raw,format=BGRx ! videoconvert ! "
+    "video/x-raw,format=BGR ! appsink drop=true max-buffers=1 sync=false"
+)
+_GST_PIPELINE_NVDEC = (
+    "rtspsrc location={url} latency=0 protocols=tcp ! rtph264depay ! h264parse ! "
+    "nvh264dec ! videoconvert ! video/x-raw,format=BGR ! "
+    "appsink drop=true max-buffers=1 sync=false"
+)
+
+
 @dataclass(frozen=True)
 class Settings:
     rtsp_url: Optional[str]
+    rtsp_gst_pipeline: Optional[str]
     camera_ip: Optional[str]
     camera_port: int
     camera_user: Optional[str]
     camera_password: Optional[str]
     model_path: str
+    engine_path: str
+    onnx_path: str
     conf_threshold: float
     tracker_cfg_name: str
+    backend: str
     skip_frames: int
+    batch_size: int
+    imgsz: int
+    int8: bool
+    calib_dir: str
+    num_threads: int
     window_name: str
 
 
 def load_settings() -> Settings:
     return Settings(
         rtsp_url=os.getenv("RTSP_URL"),
+        rtsp_gst_pipeline=os.getenv("RTSP_GST_PIPELINE"),
         camera_ip=os.getenv("CAMERA_IP"),
         camera_port=int(os.getenv("CAMERA_PORT", "80")),
         camera_user=os.getenv("CAMERA_USER"),
         camera_password=os.getenv("CAMERA_PASSWORD"),
         model_path=os.getenv("YOLO_MODEL_PATH", "yolov8n.pt"),
+        engine_path=os.getenv("YOLO_ENGINE_PATH", ""),
+        onnx_path=os.getenv("YOLO_ONNX_PATH", ""),
         conf_threshold=float(os.getenv("YOLO_CONF", "0.5")),
         tracker_cfg_name=os.getenv("YOLO_TRACKER_CFG", "botsort.yaml"),
+        # Exported backends are opt-in; the default runs the .pt weights directly.
+        backend=os.getenv("YOLO_BACKEND", "pytorch").strip().lower(),
         skip_frames=int(os.getenv("YOLO_SKIP_FRAMES", "3")),
+        batch_size=int(os.getenv("YOLO_BATCH", "1")),
+        imgsz=int(os.getenv("YOLO_IMGSZ", "640")),
+        int8=os.getenv("YOLO_INT8", "false").strip().lower() in ("1", "true", "yes"),
+        calib_dir=os.getenv("YOLO_CALIB_DIR", "calib"),
+        num_threads=int(os.getenv("YOLO_NUM_THREADS", "0")),
         window_name=os.getenv("WINDOW_NAME", "CCTV Monitoring + YOLO Detection"),
     )
 
 
+def resolve_gst_pipeline(pipeline: Optional[str], rtsp_url: Optional[str]) -> Optional[str]:
+    if not pipeline or not rtsp_url:
+        return None
+    if pipeline.strip().lower() == "auto":
+        pipeline = _GST_PIPELINE_JETSON if platform.machine() == "aarch64" else _GST_PIPELINE_NVDEC
+    return pipeline.replace("{url}", rtsp_url)
+
+
 def configure_opencv_rtsp_tcp() -> None:
     os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp"
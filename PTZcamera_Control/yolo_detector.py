@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -13,8 +14,25 @@ class YoloConfig:
     model_path: str
     conf_threshold: float
     tracker_cfg_name: str
+    # "pytorch" (plain .pt weights) | "tensorrt" (FP16 engine, CUDA only)
+    # | "onnx" (ONNX Runtime, CPU only)
+    backend: str = "pytorch"
+    engine_path: str = ""
+    onnx_path: str = ""
+    batch_size: int = 1
+    imgsz: int = 640
+    int8: bool = False
+    calib_dir: str = ""
+    # CPU intra-op threads for PyTorch; 0 keeps PyTorch's default.
+    num_threads: int = 0
 
 
+# Used for INT8 calibration when calib_dir holds no frames.
+CALIB_FALLBACK_DATA = "coco8.yaml"
+
+
+# The backend probes touch driver state and the answer cannot change at runtime.
+@lru_cache(maxsize=1)
 def select_device() -> str:
     if torch.backends.mps.is_available():
         return "mps"
@@ -23,6 +41,7 @@ def select_device() -> str:
     return "cpu"
 
 
+@lru_cache(maxsize=None)
 def resolve_tracker_cfg(name: str) -> Optional[str]:
     if os.path.isfile(name):
         return name
@@ -40,16 +59,107 @@ class YoloDetector:
     def __init__(self, config: YoloConfig):
         self.config = config
         self.device = select_device()
-        self.model = YOLO(config.model_path)
+        if self.device == "cpu" and config.num_threads > 0:
+            # Opt-in: leave cores for RTSP decode and rendering.
+            torch.set_num_threads(config.num_threads)
+        self.model = self._load_model()
         self.tracker_cfg = resolve_tracker_cfg(config.tracker_cfg_name)
         self.use_tracking = self.tracker_cfg is not None
 
-    def infer(self, frame):
+    def _load_model(self):
+        # Optionally export once to an optimized format and load that instead of
+        # the .pt weights: a TensorRT FP16 engine on CUDA (backend="tensorrt"),
+        # an ONNX graph on CPU (backend="onnx", run by ONNX Runtime with fused
+        # operators, typically 1.5-2x faster than eager PyTorch). The export is
+        # cached next to the model (or at engine_path/onnx_path) and reused on
+        # later runs; any failure falls back to .pt. conf and the tracker apply to exported models unchanged.
+        # With int8, weights are quantized using calibration frames instead:
+        # a TensorRT INT8 engine on CUDA, an OpenVINO INT8 model on CPU.
+        model_path = Path(self.config.model_path)
+        if self.config.int8 and self.device in ("cuda", "cpu"):
+            return self._load_int8(model_path)
+        if self.device == "cuda" and self.config.backend == "tensorrt":
+            # The engine's input shape is fixed, so batch must match the runtime batch.
+            return self._load_exported(
+                "TensorRT engine",
+                self.config.engine_path or str(model_path.with_suffix(".engine")),
+                format="engine",
+                half=True,
+                imgsz=self.config.imgsz,
+                batch=self.config.batch_size,
+                device=0,
+            )
+        if self.device == "cpu" and self.config.backend == "onnx":
+            return self._load_exported(
+                "ONNX model",
+                self.config.onnx_path or str(model_path.with_suffix(".onnx")),
+                format="onnx",
+                imgsz=self.config.imgsz,
+                simplify=True,
+                dynamic=self.config.batch_size > 1,
+            )
+        if self.config.backend != "pytorch":
+            print(f"YOLO_BACKEND={self.config.backend} is not supported on {self.device}. Using .pt weights.")
+        return YOLO(self.config.model_path)
+
+    def _load_int8(self, model_path: Path):
+        if self.device == "cuda":
+            return self._load_exported(
+                "TensorRT INT8 engine",
+                self.config.engine_path or str(model_path.with_name(f"{model_path.stem}_int8.engine")),
+                format="engine",
+                int8=True,
+                data=self._calibration_data(),
+                imgsz=self.config.imgsz,
+                batch=self.config.batch_size,
+                device=0,
+            )
+        return self._load_exported(
+            "OpenVINO INT8 model",
+            str(model_path.with_name(f"{model_path.stem}_int8_openvino_model")),
+            format="openvino",
+            int8=True,
+            data=self._calibration_data(),
+            imgsz=self.config.imgsz,
+        )
+
+    def _calibration_data(self) -> str:
+        # Calibrate on frames from this camera (~100-500 jpg/png in calib_dir)
+        # when available; a dataset yaml pointing at the folder is written once.
+        calib_dir = self.config.calib_dir
+        if not calib_dir or not os.path.isdir(calib_dir):
+            return CALIB_FALLBACK_DATA
+        images = [f for f in os.listdir(calib_dir) if f.lower().endswith((".jpg", ".jpeg", ".png"))]
+        if not images:
+            return CALIB_FALLBACK_DATA
+        print(f"INT8 calibration with {len(images)} frames from {calib_dir}")
+        data_yaml = os.path.join(calib_dir, "calib.yaml")
+        with open(data_yaml, "w") as f:
+            f.write(f"path: {os.path.abspath(calib_dir)}\ntrain: .\nval: .\nnames:\n  0: person\n")
+        return data_yaml
+
+    def _load_exported(self, label: str, export_path: str, **export_args):
+        try:
+            if not os.path.exists(export_path):
+                print(f"Exporting {label} (first run only): {export_path}")
+                exported = YOLO(self.config.model_path).export(**export_args)
+                if os.path.abspath(exported) != os.path.abspath(export_path):
+                    os.replace(exported, export_path)
+            return YOLO(export_path, task="detect")
+        except Exception as exc:
+            print(f"{label} unavailable: {exc} -> using {self.config.model_path}")
+            return YOLO(self.config.model_path)
+
+    def infer(self, frames):
+        # `frames` may be a single frame or a list of frames. A list runs as one
+        # batched forward pass and returns one Results per frame, in order
+        # (the tracker is updated sequentially, so IDs persist across the batch).
         if self.use_tracking:
             try:
                 return self.model.track(
-                    frame,
+                    frames,
                     conf=self.config.conf_threshold,
+                    imgsz=self.config.imgsz,
                     device=self.device,
                     tracker=self.tracker_cfg,
                     persist=True,
@@ -60,8 +170,9 @@ class YoloDetector:
                 self.use_tracking = False
                 self.model.predictor = None
         return self.model(
-            frame,
+            frames,
             conf=self.config.conf_threshold,
+            imgsz=self.config.imgsz,
             device=self.device,
             verbose=False,
         )
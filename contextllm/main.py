@@ -20,29 +20,32 @@ import yaml
 # src 폴더를 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from dotenv import load_dotenv
-
 # 설정 파일 경로
 CONFIG_DIR = Path(__file__).parent / 'config'
 CONFIG_PATH = CONFIG_DIR / 'config.yaml'
 ENV_PATH = CONFIG_DIR / '.env'
 
-# .env 파일 로드
+# .env 파일 로드 (파일이 있을 때만 dotenv 임포트)
 if ENV_PATH.exists():
+    from dotenv import load_dotenv
     load_dotenv(ENV_PATH)
 
 
 def load_config(config_path: Optional[Path] = None) -> dict:
-    """config.yaml 파일 로드"""
+    """
+    config.yaml 파일 로드
+    기본 설정 파일이면 config_manager가 임포트 시 파싱해 둔 설정을 그대로 공유 (같은 파일을 두 번 파싱하지 않음)
+    """
+    from core import config_manager
+    
     target = config_path or CONFIG_PATH
-    if target.exists():
-        with open(target, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    if target.resolve() == config_manager.CONFIG_PATH.resolve():
+        return config_manager.config
+    return config_manager.load_config(target)
 
 
-# 전역 설정 로드
-CONFIG = load_config()
+# 전역 설정 (main()에서 --config 인자를 반영해 한 번만 로드)
+CONFIG: dict = {}
 
 
 def create_system(args, config: dict, enable_speech: bool = True):
@@ -359,7 +362,7 @@ def main():
     parser.add_argument('-n', '--iterations', type=int, default=None, help='반복 횟수 (realtime 모드)')
     parser.add_argument('--model', default=None, help=f"OpenAI 모델 (기본값: {CONFIG.get('model', 'gpt-4o-mini')})")
     parser.add_argument('-v', '--verbose', action='store_true', help='상세 출력 모드')
-    parser.add_argument('--parallel', action='store_true', dest='parallel', default=None, help='호환 옵션: 현재는 순차 모니터링과 동일하게 동작')
+    parser.add_argument('--parallel', action='store_true', dest='parallel', default=None, help='병렬 분석: LLM 분석 중에도 음성 수집/화면 갱신 유지')
     parser.add_argument('--sequential', action='store_false', dest='parallel', help='순차 모니터링 강제')
     
     # 음성 인식 옵션
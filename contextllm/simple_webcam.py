@@ -15,26 +15,34 @@ def main():
         print("❌ 웹캠을 열 수 없습니다")
         return
     
+    # 드라이버에 10fps / 버퍼 1프레임 요청 (지원하는 드라이버는 캡처 단계에서 속도 제한 + 지연 프레임 누적 방지)
+    cap.set(cv2.CAP_PROP_FPS, 10)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    
     print("📹 웹캠 시작 (Ctrl+C로 종료)")
     print("   FPS 제한: 10fps\n")
     
     try:
         frame_time = 1.0 / 10  # 10fps = 0.1초
-        last_time = time.time()
+        last_time = time.monotonic()
         
         while True:
-            ret, frame = cap.read()
-            
-            if not ret:
+            # grab()은 다음 프레임까지 블로킹하며 디코딩하지 않음 (sleep 폴링 불필요)
+            if not cap.grab():
                 print("❌ 프레임 읽기 실패")
                 break
             
             # 현재 시간
-            current_time = time.time()
+            current_time = time.monotonic()
             elapsed = current_time - last_time
             
-            # 10fps 제한 (프레임 간격이 0.1초 이상일 때만 표시)
+            # 10fps 제한 (FPS 설정을 무시하는 드라이버: 간격이 0.1초 미만인 프레임은 디코딩 없이 버림)
             if elapsed >= frame_time:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    print("❌ 프레임 읽기 실패")
+                    break
+                
                 # 프레임 정보 표시
                 fps = 1.0 / elapsed
                 cv2.putText(frame, f"FPS: {fps:.1f}", (10, 30), 
@@ -47,9 +55,6 @@ def main():
                 # 키 입력 확인 (1ms 대기)
                 if cv2.waitKey(1) & 0xFF == ord('q'):
                     break
-            else:
-                # 시간이 충분하지 않으면 짧게 대기
-                time.sleep(0.01)
     
     except KeyboardInterrupt:
         print("\n⏹️  종료")
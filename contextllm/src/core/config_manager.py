@@ -22,24 +22,32 @@ from typing import Any, Optional
 
 import yaml
 
+# libyaml C 바인딩이 있으면 CSafeLoader 사용 (순수 Python SafeLoader보다 파싱이 수 배 빠름)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # 프로젝트 루트 경로 찾기
 def _find_project_root() -> Path:
-    """프로젝트 루트 디렉토리 찾기"""
-    current = Path(__file__).resolve()
+    """
+    프로젝트 루트 디렉토리 찾기
+    (임포트마다 실행되므로 Path 객체 생성 없이 os.path 문자열 연산 + isfile 한 번씩으로 확인)
+    """
+    config_rel = os.path.join('config', 'config.yaml')
     
     # src/core/config_manager.py -> src/core -> src -> project_root
-    for parent in [current.parent, current.parent.parent, current.parent.parent.parent]:
-        config_path = parent / 'config' / 'config.yaml'
-        if config_path.exists():
-            return parent
+    parent = os.path.dirname(os.path.realpath(__file__))
+    for level in range(3):
+        if level:
+            parent = os.path.dirname(parent)
+        if os.path.isfile(os.path.join(parent, config_rel)):
+            return Path(parent)
     
     # 현재 작업 디렉토리에서도 찾기
-    cwd = Path.cwd()
-    if (cwd / 'config' / 'config.yaml').exists():
-        return cwd
+    cwd = os.getcwd()
+    if os.path.isfile(os.path.join(cwd, config_rel)):
+        return Path(cwd)
     
     # 못 찾으면 현재 파일 기준 3단계 상위
-    return current.parent.parent.parent
+    return Path(parent)
 
 
 # 프로젝트 경로들
@@ -49,13 +57,28 @@ CONFIG_PATH = CONFIG_DIR / 'config.yaml'
 ENV_PATH = CONFIG_DIR / '.env'
 
 
-def load_config() -> dict:
-    """config.yaml 파일 로드"""
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
-    print(f"⚠️  설정 파일을 찾을 수 없습니다: {CONFIG_PATH}")
-    return {}
+def load_config(config_path: Optional[Path] = None) -> dict:
+    """config.yaml 파일 로드 (config_path가 없으면 프로젝트 기본 설정 파일)"""
+    target = config_path or CONFIG_PATH
+    # exists() 확인 후 open 하지 않고 바로 열기 (stat 한 번 절약, 확인-사용 사이 경쟁 조건 제거)
+    try:
+        with open(target, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=_YAML_LOADER) or {}
+    except FileNotFoundError:
+        print(f"⚠️  설정 파일을 찾을 수 없습니다: {target}")
+        return {}
+
+
+def _flatten_config(node: Any, prefix: tuple = ()) -> dict:
+    """
+    중첩 설정을 {(키 경로): 값} 평탄화 인덱스로 변환
+    (dict 섹션 자체도 해당 경로의 값으로 포함되므로 get_config('prompts') 같은 섹션 조회도 한 번에 처리)
+    """
+    flat = {prefix: node}
+    if isinstance(node, dict):
+        for key, value in node.items():
+            flat.update(_flatten_config(value, prefix + (key,)))
+    return flat
 
 
 def get_config(*keys, default=None) -> Any:
@@ -74,24 +97,20 @@ def get_config(*keys, default=None) -> Any:
         get_config('voice_analysis', 'pitch', 'high_threshold')  # 250
         get_config('없는키', default='기본값')  # '기본값'
     """
-    result = config
-    for key in keys:
-        if isinstance(result, dict) and key in result:
-            result = result[key]
-        else:
-            return default
-    return result
+    return _config_index.get(keys, default)
 
 
 def reload_config():
     """설정 다시 로드"""
-    global config
+    global config, _config_index
     config = load_config()
+    _config_index = _flatten_config(config)
     return config
 
 
-# 전역 설정 객체
+# 전역 설정 객체 (+ 키 경로 조회용 평탄화 인덱스)
 config = load_config()
+_config_index = _flatten_config(config)
 
 
 def get_api_key(service: str = 'openai') -> Optional[str]:
@@ -52,6 +52,8 @@ class OpenCVDisplay:
         self.font = cv2.FONT_HERSHEY_SIMPLEX
         self.font_scale = 0.6
         self.font_thickness = 2
+        # 상태바 시계: 초 단위로만 바뀌므로 (초, 문자열, 텍스트 너비)를 캐시해 매 프레임 strftime/getTextSize 생략
+        self._clock_cache: Tuple[int, str, int] = (-1, "", 0)
         
         # 윈도우 생성 플래그
         self.window_created = False
@@ -161,15 +163,20 @@ class OpenCVDisplay:
         cv2.rectangle(frame, (0, 0), (w, 40), self.colors['bg'], -1)
         cv2.putText(frame, "ContextLLM Live", (10, 28), self.font, 0.7, self.colors['text'], 2)
         
-        # 현재 시간 표시
-        current_time = time.strftime("%H:%M:%S")
-        time_text_size = cv2.getTextSize(current_time, self.font, 0.6, 1)[0]
-        cv2.putText(frame, current_time, (w - time_text_size[0] - 10, 28), 
+        # 현재 시간 표시 (time.time()은 한 번만 호출해 시계/결과 경과 시간에 함께 사용)
+        now = time.time()
+        second = int(now)
+        if second != self._clock_cache[0]:
+            current_time = time.strftime("%H:%M:%S", time.localtime(second))
+            time_text_width = cv2.getTextSize(current_time, self.font, 0.6, 1)[0][0]
+            self._clock_cache = (second, current_time, time_text_width)
+        _, current_time, time_text_width = self._clock_cache
+        cv2.putText(frame, current_time, (w - time_text_width - 10, 28), 
                    self.font, 0.6, self.colors['text'], 1)
         
         # 분석 결과 오버레이
         if self.current_result:
-            elapsed = time.time() - self.current_result.timestamp
+            elapsed = now - self.current_result.timestamp
             
             if elapsed < self.result_display_time:
                 self._draw_result_overlay(frame, self.current_result)
@@ -191,11 +198,11 @@ class OpenCVDisplay:
             if int(time.time() * 2) % 2 == 0:
                 cv2.rectangle(frame, (5, 5), (w-5, h-5), self.colors['critical'], 4)
         
-        # 하단 결과 박스 배경
+        # 하단 결과 박스 배경 (검정 70% 반투명 = 해당 영역 밝기 30%)
+        # 전체 프레임 복사본에 사각형을 그려 합성하지 않고 박스 영역만 제자리에서 처리 (결과 동일)
         box_height = 120
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, h - box_height), (w, h), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        box = frame[max(0, h - box_height):h]
+        cv2.addWeighted(box, 0.3, box, 0, 0, dst=box)
         
         # 좌측 색상 바
         cv2.rectangle(frame, (0, h - box_height), (8, h), color, -1)
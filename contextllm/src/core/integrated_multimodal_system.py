@@ -57,6 +57,13 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# orjson (선택사항): 결과 로그 직렬화가 표준 json보다 수 배 빠름
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 내부 모듈 임포트
 try:
     from core.voice_characteristics import VoiceCharacteristicsAnalyzer
@@ -1030,41 +1037,59 @@ class SpeechDetector:
         
         self._is_listening = True
         self._bg_audio_queue = queue.Queue()
+        pending_audio = queue.Queue()  # 캡처 스레드 -> 인식 스레드
+        
+        def capture_worker():
+            """
+            백그라운드 음성 캡처 워커
+            마이크 스트림은 한 번 열어 유지 (발화마다 PyAudio 스트림을 열고 닫지 않음)
+            인식(네트워크 요청)은 별도 스레드에서 하므로 인식 중에도 다음 발화를 계속 캡처
+            """
+            while self._is_listening:
+                try:
+                    with self.microphone as source:
+                        while self._is_listening:
+                            # 음성 감지
+                            audio = self.recognizer.listen(source, timeout=None)
+                            
+                            # 오디오 길이 확인
+                            duration = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+                            
+                            if duration < 0.5:  # 0.5초 이상만 인식 시도
+                                continue
+                            
+                            pending_audio.put(audio)
+                
+                except Exception as e:
+                    # 스트림 오류 시 마이크를 다시 열고 재시도
+                    logger.debug("Background speech capture error: %s", e)
+                    time.sleep(0.5)
         
-        def background_worker():
+        def recognize_worker():
             """백그라운드 음성 인식 워커"""
-            
             while self._is_listening:
                 try:
-                    with self.microphone as source:
-                        # 음성 감지
-                        audio = self.recognizer.listen(source, timeout=None)
-                        
-                        # 오디오 길이 확인
-                        audio_data = audio.get_raw_data()
-                        duration = len(audio_data) / (audio.sample_rate * audio.sample_width)
-                        
-                        if duration < 0.5:  # 0.5초 이상만 인식 시도
-                            continue
-                        
-                        # 텍스트 인식
-                        try:
-                            text = self.recognizer.recognize_google(audio, language=language)
-                            print(f"\n인식됨: {text}")
-                            # 큐에 추가 (메인 루프에서 꺼낼 수 있음)
-                            self._bg_audio_queue.put((text, audio))
-                        except sr.UnknownValueError:
-                            # 비음성/짧은 발화도 사운드 이벤트 감지 경로로 전달
-                            self._bg_audio_queue.put((None, audio))
-                        except sr.RequestError as e:
-                            logger.warning("Background speech recognition request failed: %s", e)
+                    audio = pending_audio.get(timeout=0.5)
+                except queue.Empty:
+                    continue
                 
+                # 텍스트 인식
+                try:
+                    text = self.recognizer.recognize_google(audio, language=language)
+                    print(f"\n인식됨: {text}")
+                    # 큐에 추가 (메인 루프에서 꺼낼 수 있음)
+                    self._bg_audio_queue.put((text, audio))
+                except sr.UnknownValueError:
+                    # 비음성/짧은 발화도 사운드 이벤트 감지 경로로 전달
+                    self._bg_audio_queue.put((None, audio))
+                except sr.RequestError as e:
+                    logger.warning("Background speech recognition request failed: %s", e)
                 except Exception as e:
-                    logger.debug("Background speech worker error: %s", e)
+                    logger.debug("Background speech recognition error: %s", e)
         
         # 백그라운드 스레드 시작
-        bg_thread = threading.Thread(target=background_worker, daemon=True)
-        bg_thread.start()
+        threading.Thread(target=capture_worker, daemon=True).start()
+        threading.Thread(target=recognize_worker, daemon=True).start()
     
     def get_recognized_speech(self):
         """
@@ -1279,6 +1304,9 @@ class IntegratedMultimodalSystem:
         # 로그 설정
         self.log_dir = Path(log_dir) if log_dir else Path("data/logs")
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        # 결과 로그 파일 쓰기는 전용 스레드 하나에서 순서대로 처리 (분석/모니터링 루프가 디스크 I/O를 기다리지 않음)
+        # 종료 시 남은 쓰기는 concurrent.futures의 인터프리터 종료 처리에서 모두 완료됨
+        self._log_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-writer")
         
         # 녹음 파일 저장 디렉토리
         self.recordings_dir = Path("recordings")
@@ -1461,6 +1489,18 @@ class IntegratedMultimodalSystem:
         Returns:
             분석 결과 딕셔너리
         """
+        result, frame = self._capture_video_only(text_input)
+        if frame is None:
+            return result
+        return self._analyze_video_only_frame(result, frame, text_input)
+    
+    def _capture_video_only(self, text_input: str = None) -> Tuple[Dict[str, Any], Optional[np.ndarray]]:
+        """
+        영상 전용 분석의 프레임 수집 단계 (현재 비디오 소스 상태를 사용하므로 호출 스레드에서 순차 실행)
+        
+        Returns:
+            (결과 딕셔너리, 대표 프레임) - 실패 시 프레임은 None이고 result["error"]가 설정됨
+        """
         result = {
             "timestamp": datetime.now().isoformat(),
             "success": False,
@@ -1475,7 +1515,7 @@ class IntegratedMultimodalSystem:
             # 1. 비디오 소스 열기
             if not self.video_manager.open():
                 result["error"] = "비디오 소스를 열 수 없습니다"
-                return result
+                return result, None
             
             # 2. 소스 타입에 따라 프레임 가져오기
             source = self.video_manager.get_source()
@@ -1488,7 +1528,7 @@ class IntegratedMultimodalSystem:
                     timestamps = [0.0]
                 else:
                     result["error"] = "이미지를 읽을 수 없습니다"
-                    return result
+                    return result, None
             # 테스트셋의 현재 파일이 이미지인 경우
             elif isinstance(source, TestsetVideoSource):
                 current_src = source.current_source
@@ -1499,7 +1539,7 @@ class IntegratedMultimodalSystem:
                         timestamps = [0.0]
                     else:
                         result["error"] = "이미지를 읽을 수 없습니다"
-                        return result
+                        return result, None
                 else:
                     # 비디오인 경우 캡처
                     frames, timestamps = self._capture_and_process_video()
@@ -1509,7 +1549,7 @@ class IntegratedMultimodalSystem:
             
             if not frames:
                 result["error"] = "프레임을 가져올 수 없습니다"
-                return result
+                return result, None
             
             # 이미지 다운샘플링 적용
             frames = [self.downsampler.downsample_image(f) for f in frames]
@@ -1519,11 +1559,20 @@ class IntegratedMultimodalSystem:
                 "timestamps": timestamps
             }
             
+            # 대표 프레임 선택 (중간 프레임)
+            return result, frames[len(frames) // 2]
+        
+        except Exception as e:
+            logger.exception("analyze_video_only failed")
+            result["error"] = str(e)
+            return result, None
+    
+    def _analyze_video_only_frame(self, result: Dict[str, Any], representative_frame: np.ndarray,
+                                  text_input: str = None) -> Dict[str, Any]:
+        """영상 전용 분석의 LLM 분석 단계 (비디오 소스를 사용하지 않으므로 워커 스레드에서 실행 가능)"""
+        try:
             # 3. 멀티모달 분석 (영상 + 텍스트 입력)
-            if self.multimodal_analyzer and frames:
-                # 대표 프레임 선택 (중간 프레임)
-                representative_frame = frames[len(frames) // 2]
-                
+            if self.multimodal_analyzer:
                 # 분석할 텍스트 (기본값: 영상 분석 요청)
                 default_text = "현재 상황을 분석해 주세요. 위험하거나 긴급한 상황인지 판단해 주세요."
                 analysis_text = text_input or default_text
@@ -1550,34 +1599,54 @@ class IntegratedMultimodalSystem:
     
     def analyze_testset_all(self, text_input: str = None) -> List[Dict[str, Any]]:
         """
-        테스트셋의 모든 파일을 순차적으로 분석
+        테스트셋의 모든 파일을 분석
+        파일 선택/프레임 수집은 순차로 하고, LLM 분석(네트워크 대기)은 워커 스레드에서 동시에 수행
+        (전체 소요 시간이 분석 시간의 합 -> 대략 최댓값 수준으로 감소)
         
         Args:
             text_input: 각 파일 분석 시 사용할 텍스트
         
         Returns:
-            각 파일의 분석 결과 리스트
+            각 파일의 분석 결과 리스트 (파일 순서 유지)
         """
         source = self.video_manager.get_source()
         if not isinstance(source, TestsetVideoSource):
             return []
         
-        results = []
         files = source.list_files()
-        
-        for i, filename in enumerate(files):
-            # 파일 선택
-            if not source.select_file(i):
-                continue
-            
-            # 분석
-            result = self.analyze_video_only(text_input)
-            result["file_index"] = i
-            result["filename"] = filename
-            
-            results.append(result)
-        
-        return results
+        max_workers = self.analysis_config.get('parallel_workers', 3)
+        pending = []  # (결과 딕셔너리, Future 또는 None)
+        
+        # 동시 분석 중에는 워커별 스트리밍 진행 표시(▓)가 섞이므로 끄고, 완료 알림은 메인 스레드에서 한 줄씩 출력
+        analyzer = self.multimodal_analyzer
+        show_progress = analyzer.show_progress if analyzer else None
+        if analyzer:
+            analyzer.show_progress = False
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="testset") as executor:
+                for i, filename in enumerate(files):
+                    # 파일 선택
+                    if not source.select_file(i):
+                        continue
+                    
+                    # 프레임 수집 후 분석은 워커에 제출
+                    result, frame = self._capture_video_only(text_input)
+                    result["file_index"] = i
+                    result["filename"] = filename
+                    future = None
+                    if frame is not None:
+                        future = executor.submit(self._analyze_video_only_frame, result, frame, text_input)
+                    pending.append((result, future))
+                
+                futures = {future: result["filename"] for result, future in pending if future}
+                for done_count, future in enumerate(as_completed(futures), 1):
+                    mark = "✓" if future.result().get("success") else "✗"
+                    print(f"   {mark} [{done_count}/{len(futures)}] {futures[future]}")
+                
+                return [future.result() if future else result for result, future in pending]
+        finally:
+            if analyzer:
+                analyzer.show_progress = show_progress
     
     # ==================== 기존 메서드 ====================
     
@@ -1659,22 +1728,10 @@ class IntegratedMultimodalSystem:
                 video_frames = []
             
             # 4. 음성 특성 분석 (병렬 처리 가능)
-            audio_path = None
             voice_features = None
             
             if has_speech and audio and self.voice_characteristics_analyzer:
-                import tempfile
-                temp_audio_file = tempfile.NamedTemporaryFile(
-                    suffix='.wav', 
-                    dir=self.recordings_dir, 
-                    delete=False,
-                    prefix='temp_audio_'
-                )
-                audio_path = Path(temp_audio_file.name)
-                temp_audio_file.close()
-                self.speech_detector.save_audio_to_wav(audio, str(audio_path))
-                
-                voice_features = self._analyze_voice_characteristics(str(audio_path))
+                voice_features = self._analyze_voice_characteristics(audio)
                 result["voice_characteristics"] = voice_features
             
             # 5. 멀티모달 분석 (음성 텍스트 + 영상)
@@ -1697,7 +1754,6 @@ class IntegratedMultimodalSystem:
                     audio_text=analysis_text,
                     image_source=representative_frame,
                     additional_context=additional_context,
-                    audio_file_path=str(audio_path) if audio_path else None
                 )
                 
                 result["multimodal_analysis"] = multimodal_result
@@ -1708,13 +1764,6 @@ class IntegratedMultimodalSystem:
             # 7. 결과 로그 저장
             self._save_result_log(result)
             
-            # 8. 임시 오디오 파일 삭제
-            if audio_path and audio_path.exists():
-                try:
-                    audio_path.unlink()
-                except Exception as e:
-                    logger.warning("Failed to delete temp audio file %s: %s", audio_path, e)
-            
             return result
         
         except Exception as e:
@@ -1722,10 +1771,12 @@ class IntegratedMultimodalSystem:
             result["error"] = str(e)
             return result
     
-    def _analyze_voice_characteristics(self, audio_path: str) -> Dict[str, Any]:
-        """음성 특성 분석"""
+    def _analyze_voice_characteristics(self, audio: Any) -> Dict[str, Any]:
+        """음성 특성 분석 (AudioData를 임시 WAV 파일 없이 메모리에서 바로 분석)"""
         try:
-            features = self.voice_characteristics_analyzer.extract_features(audio_path)
+            features = self.voice_characteristics_analyzer.extract_features_from_pcm(
+                audio.get_raw_data(convert_width=2), audio.sample_rate
+            )
             
             # 긴급도 점수 계산
             emergency_indicators = self._calculate_voice_emergency_indicators(features)
@@ -1919,14 +1970,30 @@ class IntegratedMultimodalSystem:
     
     def _save_result_log(self, result: Dict):
         """결과 로그 저장"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 결과에 기록된 분석 시각을 파일명에도 그대로 사용 (datetime.now() 재호출 없이 로그 내용과 파일명 시각 일치)
+        recorded = result.get("timestamp")
+        now = datetime.fromisoformat(recorded) if recorded else datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S_%f")[:-3]  # 병렬 분석 시 파일명 충돌 방지
         log_file = self.log_dir / f"integrated_analysis_{timestamp}.json"
         
         # numpy array 등 직렬화 불가능한 객체 처리
+        # (호출 스레드에서 복사본을 만들어 두므로 이후 result가 변경되어도 기록 내용은 그대로)
         serializable_result = self._make_serializable(result)
-        
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(serializable_result, f, ensure_ascii=False, indent=2)
+        self._log_writer.submit(self._write_result_log, log_file, serializable_result)
+    
+    @staticmethod
+    def _write_result_log(log_file: Path, serializable_result: Dict):
+        """결과 로그 파일 쓰기 (로그 쓰기 스레드에서 실행, 실패는 호출자에게 전달되지 않으므로 여기서 기록)"""
+        try:
+            if ORJSON_AVAILABLE:
+                # orjson은 항상 UTF-8(ensure_ascii=False와 동일) bytes를 반환
+                with open(log_file, 'wb') as f:
+                    f.write(orjson.dumps(serializable_result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(log_file, 'w', encoding='utf-8') as f:
+                    json.dump(serializable_result, f, ensure_ascii=False, indent=2)
+        except Exception:
+            logger.exception("Failed to write result log: %s", log_file)
     
     def _make_serializable(self, obj):
         """객체를 JSON 직렬화 가능하게 변환"""
@@ -1957,7 +2024,8 @@ class IntegratedMultimodalSystem:
             on_result: 결과 콜백 함수
             max_iterations: 최대 반복 횟수 (None이면 무한)
             verbose: 상세 출력 여부
-            parallel: 호환 옵션 (현재는 순차 처리와 동일)
+            parallel: True면 분석(음성 특성 + LLM 호출)을 워커 스레드에서 수행
+                      (분석 중에도 음성 수집/화면 갱신이 멈추지 않고 여러 발화를 동시에 분석)
         """
         if not self._require_speech_detector():
             raise RuntimeError("음성 감지기가 비활성화되어 모니터링을 시작할 수 없습니다.")
@@ -1966,9 +2034,9 @@ class IntegratedMultimodalSystem:
         self.is_monitoring = True
         self.verbose = verbose
         self.parallel = parallel
-
-        if parallel:
-            logger.warning("`parallel` mode is currently mapped to sequential monitoring for compatibility.")
+        if self.multimodal_analyzer:
+            # 병렬 분석 중에는 워커별 스트리밍 진행 표시(▓)가 한 줄에 섞이므로 끔
+            self.multimodal_analyzer.show_progress = not parallel
         
         # 카메라 미리 열기
         self.video_manager.open()
@@ -1995,7 +2063,10 @@ class IntegratedMultimodalSystem:
     
     
     def _start_monitoring_sequential(self, max_iterations: int = None):
-        """순차 모니터링: 백그라운드 음성 감지 방식"""
+        """
+        순차 모니터링: 백그라운드 음성 감지 방식
+        parallel 모드에서는 분석만 워커 스레드로 넘기고, 영상 캡처/콜백/출력/렌더링은 메인 스레드에서 처리
+        """
         print("\n🔄 모니터링 시작 (Ctrl+C로 종료)")
         print("   💡 백그라운드 음성 감지 중... 아무거나 말씀하세요!")
         
@@ -2008,14 +2079,25 @@ class IntegratedMultimodalSystem:
             return
         self.speech_detector.start_background_listening()
         
+        executor = None
+        pending = []  # 진행 중인 병렬 분석 (Future)
+        if self.parallel:
+            max_workers = self.analysis_config.get('parallel_workers', 3)
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis")
+            print(f"   ⚡ 병렬 분석 활성화 (워커 {max_workers}개)")
+        
         try:
             while self.is_monitoring:
                 if max_iterations and iteration >= max_iterations:
                     print(f"\n✅ {max_iterations}회 분석 완료!")
                     break
                 
+                # 병렬 모드: 진행 중인 분석까지 합쳐 max_iterations를 넘기지 않도록 새 제출 보류
+                # (음성은 큐에 남겨 두고, 분석이 실패해 자리가 나면 이어서 처리)
+                at_capacity = bool(executor and max_iterations and iteration + len(pending) >= max_iterations)
+                
                 # 비블로킹 - 감지된 음성이 있는지 확인
-                transcribed_text, audio = self.speech_detector.get_recognized_speech()
+                transcribed_text, audio = (None, None) if at_capacity else self.speech_detector.get_recognized_speech()
 
                 if audio is not None:
                     sound_event = self._analyze_sound_event(audio)
@@ -2036,18 +2118,21 @@ class IntegratedMultimodalSystem:
                         frame = self.downsampler.downsample_image(frame)
                     
                     # 분석 수행
-                    result = self._analyze_with_data(transcribed_text, audio, frame, sound_event=sound_event, trigger_source=trigger_source)
-                    
-                    # 분석 결과 처리
-                    if result.get("success"):
-                        iteration += 1
-                        
-                        # 콜백 호출
-                        if self.on_result_callback:
-                            self.on_result_callback(result)
-                        
-                        # 결과 출력
-                        self._print_result_summary(result, verbose=self.verbose)
+                    if executor:
+                        pending.append(executor.submit(
+                            self._analyze_with_data, transcribed_text, audio, frame,
+                            sound_event=sound_event, trigger_source=trigger_source,
+                        ))
+                    else:
+                        result = self._analyze_with_data(transcribed_text, audio, frame, sound_event=sound_event, trigger_source=trigger_source)
+                        iteration += self._handle_monitoring_result(result)
+                
+                # 완료된 병렬 분석 결과 처리 (완료 순서대로)
+                if pending:
+                    done = [future for future in pending if future.done()]
+                    for future in done:
+                        pending.remove(future)
+                        iteration += self._handle_monitoring_result(future.result())
                 
                 # 메인 스레드에서 OpenCV 렌더링 처리 (필수: 메인 스레드만 가능)
                 if self.opencv_display and self.opencv_display.is_running():
@@ -2064,8 +2149,23 @@ class IntegratedMultimodalSystem:
             # 백그라운드 리스닝 중지
             if self.speech_detector:
                 self.speech_detector.stop_background_listening()
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
             self.stop_monitoring()
     
+    def _handle_monitoring_result(self, result: Dict[str, Any]) -> bool:
+        """모니터링 분석 결과 처리 (콜백 호출 + 결과 출력). 성공 여부 반환"""
+        if not result.get("success"):
+            return False
+        
+        # 콜백 호출
+        if self.on_result_callback:
+            self.on_result_callback(result)
+        
+        # 결과 출력
+        self._print_result_summary(result, verbose=self.verbose)
+        return True
+    
     def _analyze_with_data(
         self,
         transcribed_text: Optional[str],
@@ -2093,27 +2193,11 @@ class IntegratedMultimodalSystem:
             result["video_analysis"] = {"frame_count": len(video_frames)}
             
             # 음성 특성 분석
-            audio_path = None
             voice_features = None
             
             if audio and transcribed_text:
                 if self.voice_characteristics_analyzer:
-                    import tempfile
-                    temp_audio_file = tempfile.NamedTemporaryFile(
-                        suffix='.wav', 
-                        dir=self.recordings_dir, 
-                        delete=False,
-                        prefix='temp_audio_'
-                    )
-                    audio_path = Path(temp_audio_file.name)
-                    temp_audio_file.close()
-                    if self.speech_detector:
-                        self.speech_detector.save_audio_to_wav(audio, str(audio_path))
-                    else:
-                        logger.warning("Speech detector unavailable while trying to save audio.")
-                        audio_path = None
-                    
-                    voice_features = self._analyze_voice_characteristics(str(audio_path))
+                    voice_features = self._analyze_voice_characteristics(audio)
                     result["voice_characteristics"] = voice_features
                     if voice_features:
                         print("✅ 음성 특성 분석 완료")
@@ -2141,7 +2225,6 @@ class IntegratedMultimodalSystem:
                     audio_text=analysis_text,
                     image_source=representative_frame,
                     additional_context=additional_context,
-                    audio_file_path=str(audio_path) if audio_path else None
                 )
                 
                 result["multimodal_analysis"] = multimodal_result
@@ -2151,13 +2234,6 @@ class IntegratedMultimodalSystem:
             # 로그 저장
             self._save_result_log(result)
             
-            # 임시 파일 삭제
-            if audio_path and audio_path.exists():
-                try:
-                    audio_path.unlink()
-                except Exception as e:
-                    logger.warning("Failed to delete temp audio file %s: %s", audio_path, e)
-            
             return result
         
         except Exception as e:
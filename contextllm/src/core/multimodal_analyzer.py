@@ -20,6 +20,7 @@ import sys
 import json
 import base64
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
@@ -34,6 +35,13 @@ try:
 except ImportError:
     pass
 
+# orjson (선택사항): LLM 응답 JSON 파싱이 표준 json보다 빠름
+# (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 기존 예외 처리 그대로 사용)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 try:
     import cv2
     OPENCV_AVAILABLE = True
@@ -75,6 +83,16 @@ except ImportError:
 class MultimodalAnalyzer:
     """멀티모달 컨텍스트 분석기 (오디오 + 비전)"""
     
+    PROGRESS_INTERVAL = 0.15  # 스트리밍 진행 표시(▓) 최소 출력 간격 (초)
+    
+    # 사용자 메시지의 고정 부분 (호출마다 f-string/문자열 누적 없이 한 번의 join으로 메시지 구성)
+    USER_MESSAGE_VOICE_HEADER = '**1. 음성 입력:**\n"'
+    USER_MESSAGE_FEATURES_HEADER = '"\n\n**2. 음성 특성 분석 결과:**\n'
+    USER_MESSAGE_IMAGE_SECTION = (
+        "\n**3. 영상:**\n"
+        "제공된 이미지를 분석하여 위 음성과 음성 특성과 함께 전체 상황을 판단해주세요.\n"
+    )
+    
     # 기본 시스템 프롬프트 (config가 없을 때 사용)
     DEFAULT_SYSTEM_PROMPT = """당신은 음성, 이미지, 음성 특성을 종합적으로 분석하는 상황 분석 AI입니다.
 
@@ -151,6 +169,8 @@ class MultimodalAnalyzer:
         self.use_streaming = analysis_streaming if analysis_streaming is not None else legacy_streaming
         if self.use_streaming is None:
             self.use_streaming = False
+        # 스트리밍 진행 표시(▓) 출력 여부 (병렬 분석 시 여러 워커의 출력이 섞이지 않도록 끔)
+        self.show_progress = True
         
         if VOICE_ANALYSIS_AVAILABLE and self.use_voice_characteristics:
             self.voice_analyzer = VoiceCharacteristicsAnalyzer()
@@ -250,22 +270,18 @@ class MultimodalAnalyzer:
             base64_image = self.encode_image_to_base64(image_source)
             
             # 사용자 메시지 구성 (음성 + 특성 + 영상)
-            user_message = f"""**1. 음성 입력:**
-"{audio_text}"
-"""
-            
             if additional_context:
-                user_message += f"""
-**2. 음성 특성 분석 결과:**
-{additional_context}
-"""
+                user_message = "".join((
+                    self.USER_MESSAGE_VOICE_HEADER, str(audio_text),
+                    self.USER_MESSAGE_FEATURES_HEADER, additional_context, "\n",
+                    self.USER_MESSAGE_IMAGE_SECTION,
+                ))
             else:
                 print("⚠️  음성 특성 분석 정보 없음")
-            
-            user_message += f"""
-**3. 영상:**
-제공된 이미지를 분석하여 위 음성과 음성 특성과 함께 전체 상황을 판단해주세요.
-"""
+                user_message = "".join((
+                    self.USER_MESSAGE_VOICE_HEADER, str(audio_text), '"\n',
+                    self.USER_MESSAGE_IMAGE_SECTION,
+                ))
             
             # 메시지 구성
             messages = [
@@ -293,8 +309,10 @@ class MultimodalAnalyzer:
             
             # OpenAI API 호출 (스트리밍 또는 일반)
             if self.use_streaming:
-                content = ""
-                print("   ", end="", flush=True)
+                content_parts = []
+                last_progress = 0.0
+                if self.show_progress:
+                    print("   ", end="", flush=True)
                 response = self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,
@@ -305,10 +323,15 @@ class MultimodalAnalyzer:
                 )
                 for chunk in response:
                     if chunk.choices[0].delta.content:
-                        chunk_content = chunk.choices[0].delta.content
-                        content += chunk_content
-                        print("▓", end="", flush=True)  # 진행 표시
-                print(" ✓")  # 완료 표시
+                        content_parts.append(chunk.choices[0].delta.content)
+                        # 진행 표시: 토큰마다 flush(write syscall)하지 않고 최대 PROGRESS_INTERVAL초에 한 번만 출력
+                        now = time.monotonic()
+                        if self.show_progress and now - last_progress >= self.PROGRESS_INTERVAL:
+                            print("▓", end="", flush=True)
+                            last_progress = now
+                content = "".join(content_parts)
+                if self.show_progress:
+                    print(" ✓")  # 완료 표시
             else:
                 response = self.client.chat.completions.create(
                     model=self.model,
@@ -341,17 +364,24 @@ class MultimodalAnalyzer:
                 }
             
             # JSON 파싱
-            try:
-                # 코드 블록 제거 (```json ... ```)
-                if '```json' in content:
-                    content = content.split('```json')[1].split('```')[0].strip()
-                elif '```' in content:
-                    content = content.split('```')[1].split('```')[0].strip()
-                
-                result = json.loads(content)
+            content = content or ''
+            # 코드 블록 제거 (```json ... ```)
+            if '```json' in content:
+                content = content.split('```json')[1].split('```')[0].strip()
+            elif '```' in content:
+                content = content.split('```')[1].split('```')[0].strip()
+            
+            # JSON 객체가 아닌 응답은 예외 처리 경로를 거치지 않고 바로 실패 처리
+            result = None
+            if content.lstrip()[:1] == '{':
+                try:
+                    result = json_loads(content)
+                except json.JSONDecodeError as e:
+                    print(f"❌ JSON 파싱 오류: {e}")
+            else:
+                print("❌ JSON 파싱 오류: JSON 객체가 아닌 응답")
             
-            except json.JSONDecodeError as e:
-                print(f"❌ JSON 파싱 오류: {e}")
+            if not isinstance(result, dict):
                 print(f"원본 응답:\n{content}")
                 return {
                     'error': 'JSON 파싱 실패',
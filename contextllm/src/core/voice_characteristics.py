@@ -10,21 +10,26 @@
 """
 
 import os
+import importlib.util
 import numpy as np
 from typing import Dict, Any, Optional, Tuple
 
-try:
-    import librosa
-    LIBROSA_AVAILABLE = True
-except ImportError:
-    LIBROSA_AVAILABLE = False
+# librosa는 임포트 비용이 크므로(numba/scipy 로드) 설치 여부만 확인하고 실제 특성 추출 시점에 로드
+# (음성 분석을 쓰지 않는 testset/webcam 모드의 시작 시간 단축)
+LIBROSA_AVAILABLE = importlib.util.find_spec('librosa') is not None
+if not LIBROSA_AVAILABLE:
     print("⚠️  librosa가 설치되지 않았습니다. 음성 특성 분석이 제한됩니다.")
+librosa = None
 
-try:
-    import scipy
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
+SCIPY_AVAILABLE = importlib.util.find_spec('scipy') is not None
+
+
+def _load_librosa():
+    """librosa 지연 로드 (최초 특성 추출 시 한 번)"""
+    global librosa
+    if librosa is None:
+        import librosa as _librosa
+        librosa = _librosa
 
 # 설정 관리자 임포트
 try:
@@ -101,24 +106,57 @@ class VoiceCharacteristicsAnalyzer:
             return self._get_default_features()
         
         try:
+            _load_librosa()
             # 오디오 로드
             y, sr = librosa.load(audio_file_path, sr=sr)
+            return self._extract_all(y, sr)
+        
+        except Exception as e:
+            print(f"⚠️  음성 특성 추출 실패: {e}")
+            return self._get_default_features()
+    
+    def extract_features_from_pcm(self, pcm: bytes, sample_rate: int, sr: int = None) -> Dict[str, Any]:
+        """
+        16bit mono PCM 데이터에서 특성 추출 (WAV 파일 저장/재로딩 없이 메모리에서 직접 분석)
+        
+        Args:
+            pcm: 16bit little-endian mono PCM 바이트 (AudioData.get_raw_data(convert_width=2))
+            sample_rate: pcm의 샘플링 레이트
+            sr: 분석 샘플링 레이트 (None이면 config에서 로드)
+        
+        Returns:
+            음성 특성 딕셔너리 (extract_features와 동일)
+        """
+        if sr is None:
+            sr = self.sample_rate
             
-            features = {
-                'pitch': self._extract_pitch(y, sr),
-                'energy': self._extract_energy(y),
-                'speech_rate': self._estimate_speech_rate(y, sr),
-                'spectral_characteristics': self._extract_spectral_features(y, sr),
-                'voiced_unvoiced_ratio': self._analyze_voiced_unvoiced(y, sr),
-                'jitter_shimmer': self._extract_jitter_shimmer(y, sr)
-            }
-            
-            return features
+        if not LIBROSA_AVAILABLE:
+            print("⚠️  librosa가 설치되지 않았습니다")
+            return self._get_default_features()
+        
+        try:
+            _load_librosa()
+            # librosa.load와 동일하게 [-1, 1] float32로 정규화 후 리샘플링
+            y = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+            if sample_rate != sr:
+                y = librosa.resample(y, orig_sr=sample_rate, target_sr=sr)
+            return self._extract_all(y, sr)
         
         except Exception as e:
             print(f"⚠️  음성 특성 추출 실패: {e}")
             return self._get_default_features()
     
+    def _extract_all(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
+        """로드된 신호에서 전체 특성 추출"""
+        return {
+            'pitch': self._extract_pitch(y, sr),
+            'energy': self._extract_energy(y),
+            'speech_rate': self._estimate_speech_rate(y, sr),
+            'spectral_characteristics': self._extract_spectral_features(y, sr),
+            'voiced_unvoiced_ratio': self._analyze_voiced_unvoiced(y, sr),
+            'jitter_shimmer': self._extract_jitter_shimmer(y, sr)
+        }
+    
     def _extract_pitch(self, y: np.ndarray, sr: int) -> Dict[str, float]:
         """기본 주파수(Pitch) 추출"""
         try:
@@ -3,14 +3,12 @@
 Google Realtime STT 분석기
 """
 
-from google.cloud import speech_v1
-import pyaudio
-from queue import Queue
-
 class GoogleRealtimeAnalyzer:
     """Google Cloud Speech-to-Text 실시간 분석"""
     
     def __init__(self):
+        # google-cloud-speech는 임포트 비용이 크므로 실제로 사용할 때만 로드
+        from google.cloud import speech_v1
         self.client = speech_v1.SpeechClient()
         self.config = speech_v1.RecognitionConfig(
             encoding=speech_v1.RecognitionConfig.AudioEncoding.LINEAR16,
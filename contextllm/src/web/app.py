@@ -11,6 +11,7 @@ import threading
 import time
 import cv2
 import base64
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from flask import Flask, render_template, jsonify, Response
@@ -32,12 +33,14 @@ cors_origins = ["http://localhost:5000", "http://127.0.0.1:5000", "http://localh
 socketio = SocketIO(app, cors_allowed_origins=cors_origins, async_mode='threading', 
                    ping_timeout=120, ping_interval=25)
 
-# 전역 변수: 최근 분석 결과들
-analysis_results = []
+# 전역 변수: 최근 분석 결과들 (최신순, MAX_RESULTS 초과 시 가장 오래된 결과가 자동으로 버려짐)
 MAX_RESULTS = 50  # 최대 저장 결과 수
+analysis_results = deque(maxlen=MAX_RESULTS)
 
 # 비디오 스트리밍 관련
 video_frame = None
+video_frame_seq = 0  # push_frame마다 증가 (새 프레임일 때만 인코딩/전송)
+encoded_frame = (-1, None)  # (seq, JPEG bytes): 접속한 클라이언트들이 같은 인코딩 결과를 공유
 video_frame_lock = threading.Lock()
 video_streaming_enabled = False
 
@@ -96,15 +99,11 @@ class DashboardServer:
     
     def push_result(self, result: dict):
         """분석 결과를 대시보드에 푸시"""
-        global analysis_results
-        
         # 결과 정리 (웹 전송용)
         formatted = self._format_result(result)
         
-        # 저장
-        analysis_results.insert(0, formatted)
-        if len(analysis_results) > MAX_RESULTS:
-            analysis_results = analysis_results[:MAX_RESULTS]
+        # 저장 (리스트 앞 삽입 + 슬라이스 복사 대신 O(1) appendleft)
+        analysis_results.appendleft(formatted)
         
         # 웹소켓으로 실시간 전송
         socketio.emit('new_result', formatted)
@@ -179,14 +178,13 @@ def index():
 @app.route('/api/results')
 def get_results():
     """최근 분석 결과 API"""
-    return jsonify(analysis_results)
+    return jsonify(list(analysis_results))
 
 
 @app.route('/api/clear')
 def clear_results():
     """결과 초기화"""
-    global analysis_results
-    analysis_results = []
+    analysis_results.clear()
     socketio.emit('clear_results')
     return jsonify({'status': 'cleared'})
 
@@ -198,17 +196,28 @@ def video_status():
 
 
 def generate_frames():
-    """MJPEG 스트림 생성"""
-    global video_frame
+    """
+    MJPEG 스트림 생성
+    - 락은 프레임 참조만 가져올 때 잡고 JPEG 인코딩은 락 밖에서 수행 (push_frame/다른 요청을 막지 않음)
+    - 새 프레임일 때만 인코딩/전송하며, 같은 프레임의 인코딩 결과는 모든 클라이언트가 공유
+    """
+    global encoded_frame
+    last_seq = -1
     while True:
         with video_frame_lock:
-            if video_frame is not None:
-                # JPEG 인코딩
-                ret, buffer = cv2.imencode('.jpg', video_frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
-                if ret:
-                    frame_bytes = buffer.tobytes()
-                    yield (b'--frame\r\n'
-                           b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+            frame, seq = video_frame, video_frame_seq
+            cached_seq, frame_bytes = encoded_frame
+        if frame is not None and seq != last_seq:
+            if cached_seq != seq:
+                # JPEG 인코딩 (push_frame은 매번 새 배열을 넣으므로 락 밖에서 읽어도 안전)
+                ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
+                frame_bytes = buffer.tobytes() if ret else None
+                with video_frame_lock:
+                    encoded_frame = (seq, frame_bytes)
+            if frame_bytes is not None:
+                yield (b'--frame\r\n'
+                       b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+            last_seq = seq
         time.sleep(0.033)  # ~30fps
 
 
@@ -225,7 +234,7 @@ def video_feed():
 @socketio.on('connect')
 def handle_connect():
     """클라이언트 연결 시"""
-    emit('init_results', analysis_results)
+    emit('init_results', list(analysis_results))
     emit('video_status', {'enabled': video_streaming_enabled})
 
 
@@ -242,9 +251,11 @@ def push_result(result: dict):
 
 def push_frame(frame):
     """비디오 프레임 업데이트"""
-    global video_frame
+    global video_frame, video_frame_seq
+    frame = frame.copy() if frame is not None else None  # 복사는 락 밖에서
     with video_frame_lock:
-        video_frame = frame.copy() if frame is not None else None
+        video_frame = frame
+        video_frame_seq += 1
 
 
 def enable_video_stream(enable: bool = True):
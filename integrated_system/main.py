@@ -59,9 +59,11 @@ from integrated_system.modules.server_reporter import ServerReporterModule
 def load_config(config_path: str) -> dict:
     """설정 파일 로드 (YAML + 환경변수 오버라이드)"""
     config = {}
-    if os.path.exists(config_path):
+    try:
         with open(config_path, 'r', encoding='utf-8') as f:
             config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        pass
 
     # .env 로드
     env_path = PROJECT_ROOT / ".env"
@@ -361,9 +363,7 @@ def run_main_loop(orch: Orchestrator, stream: SharedStreamManager, config: dict,
                     display_frame = yolo_mod.get_annotated_frame(display_frame, display_yolo_objects)
 
                 # ── 2. 상단 정보 바 (반투명 검정) ──
-                overlay = display_frame.copy()
-                cv2.rectangle(overlay, (0, 0), (w, 80), (0, 0, 0), -1)
-                cv2.addWeighted(overlay, 0.7, display_frame, 0.3, 0, display_frame)
+                _darken_rows(display_frame, 0, 81, 0.3)
 
                 # FPS
                 cv2.putText(display_frame, f"FPS: {fps:.1f}", (10, 25),
@@ -408,9 +408,7 @@ def run_main_loop(orch: Orchestrator, stream: SharedStreamManager, config: dict,
                 panel_y = h - panel_h
 
                 # 반투명 하단 배경
-                overlay2 = display_frame.copy()
-                cv2.rectangle(overlay2, (0, panel_y), (w, h), (0, 0, 0), -1)
-                cv2.addWeighted(overlay2, 0.75, display_frame, 0.25, 0, display_frame)
+                _darken_rows(display_frame, panel_y, h, 0.25)
 
                 # STT 텍스트 표시 (10초간 유지)
                 stt_text_display = display_stt_text if (time.time() - display_stt_time < 10) else ""
@@ -487,6 +485,18 @@ def run_main_loop(orch: Orchestrator, stream: SharedStreamManager, config: dict,
         logger.info("\n사용자 중단 (Ctrl+C)")
 
 
+def _darken_rows(frame, y0: int, y1: int, keep: float):
+    """
+    frame의 [y0, y1) 행 영역에 반투명 검정 배경 적용 (밝기 * keep)
+
+    전체 프레임을 복사해 사각형을 그린 뒤 addWeighted 하는 것과 결과는 같지만,
+    해당 행 영역만 제자리에서 처리하므로 프레임 크기의 할당/복사가 없음
+    """
+    band = frame[max(0, y0):max(0, y1)]
+    if band.size:
+        cv2.addWeighted(band, keep, band, 0, 0, dst=band)
+
+
 def _draw_doa_compass(frame, angle_deg: float, x: int, y: int, radius: int = 40):
     """
     DOA 방향 미니 컴퍼스 그리기
@@ -497,10 +507,12 @@ def _draw_doa_compass(frame, angle_deg: float, x: int, y: int, radius: int = 40)
         x, y: 컴퍼스 중심 좌표
         radius: 컴퍼스 반지름
     """
-    # 배경 원 (반투명)
-    overlay = frame.copy()
-    cv2.circle(overlay, (x, y), radius + 5, (0, 0, 0), -1)
-    cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)
+    # 배경 원 (반투명) - 전체 프레임 대신 원을 감싸는 영역만 복사해서 합성
+    x0, y0 = max(0, x - radius - 5), max(0, y - radius - 5)
+    roi = frame[y0:y + radius + 6, x0:x + radius + 6]
+    overlay = roi.copy()
+    cv2.circle(overlay, (x - x0, y - y0), radius + 5, (0, 0, 0), -1)
+    roi[:] = cv2.addWeighted(overlay, 0.5, roi, 0.5, 0)
 
     # 외곽 원
     cv2.circle(frame, (x, y), radius, (100, 100, 100), 2)
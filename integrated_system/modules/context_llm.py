@@ -160,11 +160,14 @@ class ContextLLMModule(BaseModule):
         """config.yaml 로드"""
         try:
             import yaml
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {}
-        except Exception:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f) or {}
+        except FileNotFoundError:
             pass
+        except ImportError:
+            logger.warning("[ContextLLM] PyYAML 없음 - 기본 설정 사용")
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            logger.warning(f"[ContextLLM] config.yaml 로드 실패: {e}")
         return {}
 
     # ─── 이벤트 핸들러 ───
@@ -21,10 +21,12 @@ async def get_dashboard():
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "security_logs.db")
 # --- DB 초기화 ---
+# 이벤트마다 connect/close(파일 open + 스키마 로드)를 반복하지 않도록 연결 하나를 재사용
+# (async 핸들러는 모두 이벤트 루프 스레드에서 실행되므로 check_same_thread=False로 공유)
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS event_logs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             timestamp TEXT,
@@ -38,9 +40,9 @@ def init_db():
         )
     """)
     conn.commit()
-    conn.close()
+    return conn
 
-init_db()
+db_conn = init_db()
 
 # --- 웹소켓 매니저 ---
 class ConnectionManager:
@@ -83,17 +85,13 @@ async def receive_event(request: Request):
     description = payload.get('situation', payload.get('text', ''))
 
     # 3. DB 저장 (더 많은 컬럼 사용)
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
     # 주의: 테이블 생성(init_db) 시 아래 컬럼들이 추가되어 있어야 합니다.
-    cursor.execute("""
+    db_conn.execute("""
         INSERT INTO event_logs 
         (timestamp, source, event_type, priority, angle, person_count, description, payload) 
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
     """, (timestamp_str, source, event_type, priority, angle, person_count, description, json.dumps(payload)))
-    
-    conn.commit()
-    conn.close()
+    db_conn.commit()
 
     await manager.broadcast(data)
     return {"status": "success"}
@@ -101,13 +99,8 @@ async def receive_event(request: Request):
 # 2. 과거 로그 조회 (대시보드 초기 로딩용)
 @app.get("/logs")
 async def get_logs():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM event_logs ORDER BY id DESC LIMIT 50")
-    logs = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    return logs
+    cursor = db_conn.execute("SELECT * FROM event_logs ORDER BY id DESC LIMIT 50")
+    return [dict(row) for row in cursor.fetchall()]
 
 # 3. 실시간 웹소켓 연결
 @app.websocket("/ws/monitor")
@@ -56,6 +56,7 @@ class UnifiedPTZController:
         # ★ 원본 PTZCameraManager 인스턴스 (ONVIF용) ★
         self._onvif_mgr = None
         self._hikvision_auth = None
+        self._hikvision_session = None  # AbsoluteMove마다 연결/Digest 인증을 새로 맺지 않도록 재사용
         self._connected = False
 
     def initialize(self) -> bool:
@@ -126,11 +127,14 @@ class UnifiedPTZController:
         인증 정보만 설정 (실제 이동은 _absolute_move에서 처리)
         """
         try:
+            import requests
             from requests.auth import HTTPDigestAuth
             self._hikvision_auth = HTTPDigestAuth(
                 self.config.get("camera_user", ""),
                 self.config.get("camera_password", ""),
             )
+            self._hikvision_session = requests.Session()
+            self._hikvision_session.auth = self._hikvision_auth
             logger.info("[PTZ] Hikvision HTTP 인증 설정 완료")
         except Exception as e:
             logger.error(f"[PTZ] Hikvision HTTP 설정 실패: {e}")
@@ -193,7 +197,6 @@ class UnifiedPTZController:
         if not self._hikvision_auth:
             return
         try:
-            import requests
             url = f"http://{self.config.get('camera_ip')}/ISAPI/PTZCtrl/channels/1/absolute"
 
             azimuth = int(pan * 10) if pan is not None else 0
@@ -209,7 +212,7 @@ class UnifiedPTZController:
                 </AbsoluteHigh>
             </PTZData>"""
 
-            requests.put(url, data=xml_data, auth=self._hikvision_auth, timeout=1)
+            self._hikvision_session.put(url, data=xml_data, timeout=1)
         except Exception as e:
             logger.error(f"[PTZ] AbsoluteMove 오류: {e}")
 
@@ -241,4 +244,6 @@ class UnifiedPTZController:
     def shutdown(self) -> None:
         """종료"""
         self.stop()
+        if self._hikvision_session:
+            self._hikvision_session.close()
         logger.info("[PTZ] 종료 완료")
@@ -1,6 +1,7 @@
 import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import datetime
 from typing import Dict, Any
@@ -30,6 +31,13 @@ class ServerReporterModule(BaseModule):
         self._send_count = 0
         self._fail_count = 0
 
+        # 전송마다 TCP 연결을 새로 맺지 않도록 세션(커넥션 풀) 재사용
+        # (이벤트 핸들러가 여러 스레드에서 호출될 수 있어 풀 크기를 여유 있게 설정)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         # --- 전송 빈도 조절(Throttling) 설정 ---
         self.last_sent_time = {
             "PERSON_DETECTED": 0,
@@ -135,7 +143,7 @@ class ServerReporterModule(BaseModule):
             # timestamp 자동 추가
             payload["timestamp"] = time.time()
             
-            response = requests.post(self.server_url, json=payload, timeout=self.timeout)
+            response = self._session.post(self.server_url, json=payload, timeout=self.timeout)
             if response.status_code == 200:
                 self._send_count += 1
                 return True
@@ -155,4 +163,5 @@ class ServerReporterModule(BaseModule):
 
     def shutdown(self) -> None:
         """BaseModule 필수 구현: 종료 시 처리"""
+        self._session.close()
         logger.info(f"[ServerReporter] 종료 (성공: {self._send_count}, 실패: {self._fail_count})")
\ No newline at end of file